@@ -1,4 +1,9 @@
 """
 AI Personal Assistant package.
 """
-__version__ = '1.0.0'
\ No newline at end of file
+import logging
+
+# Library default: don't configure the root logger; entry points do that
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
+__version__ = '1.0.0'
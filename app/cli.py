@@ -2,15 +2,22 @@
 Command-line interface for testing the AI Personal Assistant without WhatsApp.
 """
 import sys
+import logging
 
 from app.nlp.intent_recognizer import IntentRecognizer
 from app.nlp.entity_extractor import EntityExtractor
 from app.services.email_service import EmailService
 from app.services.calendar_service import CalendarService
 from app.services.contacts_service import ContactsService
+from app.config import LOG_LEVEL
 
 def main():
     """Run the assistant in CLI mode."""
+    logging.basicConfig(
+        level=LOG_LEVEL,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
+    
     print("Starting AI Personal Assistant CLI mode...")
     print("Type 'exit' to quit.\n")
     
@@ -18,7 +25,7 @@ def main():
     intent_recognizer = IntentRecognizer()
     entity_extractor = EntityExtractor()
     email_service = EmailService()
-    calendar_service = CalendarService()
+    calendar_service = CalendarService.instance()
     contacts_service = ContactsService()
     
     # Mock user state for multi-step conversations
@@ -42,6 +42,13 @@ TWILIO_WEBHOOK_URL = os.getenv('TWILIO_WEBHOOK_URL')
 APPLICATION_NAME = os.getenv('APPLICATION_NAME', 'AI Personal Assistant')
 TIME_ZONE = os.getenv('TIME_ZONE', 'Asia/Kolkata')  # Changed from 'UTC' to 'Asia/Kolkata'
 DEBUG = os.getenv('DEBUG', 'False').lower() == 'true'
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'DEBUG' if DEBUG else 'INFO').upper()
+QUANTIZE_MODELS = os.getenv('QUANTIZE_MODELS', 'True').lower() == 'true'  # INT8 fallback transformer models
+INTENT_ONNX_MODEL_PATH = os.getenv('INTENT_ONNX_MODEL_PATH')  # Exported ONNX zero-shot model (optional)
+COMPILE_MODELS = os.getenv('COMPILE_MODELS', 'False').lower() == 'true'  # torch.compile fallback transformer models
+WARMUP_MODELS = os.getenv('WARMUP_MODELS', 'True').lower() == 'true'  # Load local models at startup when they'll be used
+GOOGLE_CALENDAR_RATE_LIMIT = float(os.getenv('GOOGLE_CALENDAR_RATE_LIMIT', '10'))  # Calendar API requests per second
+CONVERSATION_TTL_MINUTES = int(os.getenv('CONVERSATION_TTL_MINUTES', '30'))  # Drop conversations idle this long
 SERVER_HOST = os.getenv('SERVER_HOST', '0.0.0.0')
 SERVER_PORT = int(os.getenv('SERVER_PORT', '5000'))
 
@@ -3,6 +3,7 @@ Main application entry point for the AI Personal Assistant.
 Supports both Twilio WhatsApp API mode and CLI testing mode.
 """
 import os
+import logging
 import signal
 import sys
 import time
@@ -13,7 +14,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from app.whatsapp.twilio_client import TwilioWhatsAppClient
 from app.whatsapp.webhook_server import WebhookServer
 from app.whatsapp.message_handler import MessageHandler
-from app.config import DEBUG, DEFAULT_PHONE_NUMBER
+from app.config import DEBUG, DEFAULT_PHONE_NUMBER, LOG_LEVEL
 
 def signal_handler(sig, frame):
     """Handle interrupt signals to exit gracefully."""
@@ -94,8 +95,8 @@ def start_twilio_mode():
         print("Exiting...")
         return
     
-    # Initialize message handler
-    message_handler = MessageHandler(twilio_client)
+    # Initialize message handler; replies are sent in the background so handling isn't held up by Twilio
+    message_handler = MessageHandler(twilio_client, background_send=True)
     
     # Start webhook server
     webhook_server = WebhookServer(
@@ -140,6 +141,12 @@ def main():
     
     args = parser.parse_args()
     
+    # Configure logging for the whole application
+    logging.basicConfig(
+        level=LOG_LEVEL,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
+    
     # Register signal handlers for graceful exit
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
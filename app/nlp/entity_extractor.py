@@ -3,36 +3,203 @@ Entity extraction for user messages using OpenAI and Hugging Face transformers.
 """
 import re
 import datetime
+import functools
+import itertools
+import logging
+import threading
 import dateparser
 import torch
 from transformers import AutoTokenizer, AutoModelForTokenClassification, pipeline
+from app.nlp.model_utils import compile_model, quantize_model
+from app.utils.cache import TTLCache
 from app.utils.helpers import get_current_time
-from app.utils.llm import OpenRouterClient
+from app.utils.llm import get_openrouter_client
+
+logger = logging.getLogger(__name__)
+
+# Specific time and duration patterns
+_TIME_REGEX = re.compile(r'\d{1,2}(?::\d{2})?\s*(?:am|pm|AM|PM)?')
+_DURATION_REGEX = re.compile(r'(\d+)\s*(hour|minute|min)s?')
+
+# Default entity dicts, copied per call instead of rebuilt from literals
+_ENTITIES_TEMPLATE = {
+    "person": (),
+    "date": None,
+    "time": None,
+    "duration": None,
+    "email": (),
+    "subject": None,
+    "body": None,
+    "location": None
+}
+_DATETIME_ENTITIES_TEMPLATE = {"date": None, "time": None, "duration": None}
+_EMAIL_ENTITIES_TEMPLATE = {"subject": None, "body": None}
+_MEETING_ENTITIES_TEMPLATE = {"location": None, "subject": None}
+
+# Map NER entity groups to the entity slot they fill
+_NER_SLOTS = {
+    "PER": "person",
+    "B-PER": "person",
+    "LOC": "location",
+    "B-LOC": "location",
+    "ORG": "location_if_empty",  # Organizations only stand in for a missing location
+    "B-ORG": "location_if_empty",
+}
+
+# Words following a contact cue word, e.g. "contact info for John Smith"; the
+# capitalized ones are kept by the caller, since re has no Unicode uppercase class.
+# The lookahead leaves the words unconsumed so a later cue can still match
+_NAME_AFTER_CUE_REGEX = re.compile(
+    r'(?<!\S)(?i:for|about|contact|information)\s+(?=([^\W\d_]\S*(?:\s+[^\W\d_]\S*)*))'
+)
+
+# Cheap check for date/time vocabulary before calling the expensive dateparser
+_DATEISH_REGEX = re.compile(
+    r'\d'
+    r'|\b(?:today|tonight|tomorrow|yesterday|noon|midnight'
+    r'|morning|afternoon|evening|night'
+    r'|next|last|this|week|weekend|month|year|day|hour|minute|ago'
+    r'|(?:mon|tue|wed|thu|fri|sat|sun)[a-z]*'
+    r'|(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*)\b',
+    re.IGNORECASE
+)
+
+_EMAIL_REGEX = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+
+# Email subject/body patterns, fused into one regex each. Every alternative
+# has its own named group, so match.lastgroup tells which one matched.
+_SUBJECT_REGEX = re.compile("|".join([
+    r'subject\s*(?:is|:)\s*["\'"]?(?P<subject>.*?)["\'"]?(?:\s|$)',
+    r'about\s*["\'"]?(?P<about>.*?)["\'"]?(?:\s|$)',
+    r'regarding\s*["\'"]?(?P<regarding>.*?)["\'"]?(?:\s|$)'
+]), re.IGNORECASE)
+
+_BODY_REGEX = re.compile("|".join([
+    r'body\s*(?:is|:)\s*["\'"]?(?P<body>.*?)["\'"]?(?:\s|$)',
+    r'content\s*(?:is|:)\s*["\'"]?(?P<content>.*?)["\'"]?(?:\s|$)',
+    r'message\s*(?:is|:)\s*["\'"]?(?P<message>.*?)["\'"]?(?:\s|$)'
+]), re.IGNORECASE)
+
+# Meeting location/subject patterns
+_LOCATION_REGEX = re.compile("|".join([
+    r'(?:at|in)\s+(?:the\s+)?["\'"]?(?P<at>[\w\s]+)["\'"]?(?:\s|$)',
+    r'location\s*(?:is|:)\s*["\'"]?(?P<location>[\w\s]+)["\'"]?(?:\s|$)',
+    r'place\s*(?:is|:)\s*["\'"]?(?P<place>[\w\s]+)["\'"]?(?:\s|$)'
+]), re.IGNORECASE)
+
+# Time-related words that might be misidentified as locations
+_TIME_WORDS = frozenset({
+    'today', 'tomorrow', 'morning', 'afternoon', 'evening', 'night',
+    'tonight', 'noon', 'midnight'
+})
+
+_MEETING_SUBJECT_REGEX = re.compile("|".join([
+    r'about\s*["\'"]?(?P<about>.*?)["\'"]?(?:\s|$)',
+    r'regarding\s*["\'"]?(?P<regarding>.*?)["\'"]?(?:\s|$)',
+    r'title\s*(?:is|:)\s*["\'"]?(?P<title>.*?)["\'"]?(?:\s|$)',
+    r'subject\s*(?:is|:)\s*["\'"]?(?P<subject>.*?)["\'"]?(?:\s|$)'
+]), re.IGNORECASE)
+
+# Formats tried with strptime before falling back to dateparser
+_DATE_FORMATS = ("%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y")
+_TIME_FORMATS = ("%H:%M", "%H:%M:%S", "%I:%M %p", "%I %p", "%I:%M%p", "%I%p")
+
+def _parse_date_string(date_str):
+    """Parse a date string into a date object, or None if it can't be parsed."""
+    for date_format in _DATE_FORMATS:
+        try:
+            return datetime.datetime.strptime(date_str, date_format).date()
+        except ValueError:
+            continue
+    
+    # Try to parse with dateparser if format is different
+    parsed_date = dateparser.parse(date_str, languages=['en'])
+    return parsed_date.date() if parsed_date else None
+
+def _parse_time_string(time_str):
+    """Parse a time string into a time object, or None if it can't be parsed."""
+    for time_format in _TIME_FORMATS:
+        try:
+            return datetime.datetime.strptime(time_str, time_format).time()
+        except ValueError:
+            continue
+    
+    # Try to parse with dateparser
+    return _parse_time_expression(time_str)
+
+@functools.lru_cache(maxsize=2048)
+def _parse_time_expression(time_str):
+    """Parse a standalone time expression like '3pm' or '15:30' into a time object."""
+    parsed_time = dateparser.parse(time_str, languages=['en'])
+    return parsed_time.time() if parsed_time else None
 
 class EntityExtractor:
     def __init__(self):
         """Initialize the entity extractor with OpenRouter and transformer models."""
-        # Initialize OpenRouter client
-        self.openrouter_client = OpenRouterClient()
+        # Share the process-wide OpenRouter client
+        self.openrouter_client = get_openrouter_client()
+        
+        # Transformer NER pipeline is loaded on first use (see _ensure_model),
+        # since OpenRouter normally answers and the model is large
+        self.ner_pipeline = None
+        self.initialized = False
+        self._model_loaded = False
+        self._model_lock = threading.Lock()
+        
+        # Repeated messages skip extraction; the key includes the current minute
+        # because relative expressions ("tomorrow", "in 2 hours") depend on it
+        self._entity_cache = TTLCache(maxsize=2048, ttl=60)
+    
+    def _ensure_model(self):
+        """
+        Load the fallback NER pipeline if it hasn't been loaded yet.
         
-        # Initialize transformer model as fallback
-        try:
-            # Use a pre-trained NER model
-            model_name = "dslim/bert-base-NER"  # Good efficient NER model
+        Returns:
+            True if the pipeline is available, False otherwise
+        """
+        if self._model_loaded:
+            return self.initialized
+        
+        with self._model_lock:
+            # Another thread may have loaded the pipeline while we waited
+            if self._model_loaded:
+                return self.initialized
             
-            # Initialize NER pipeline
-            self.ner_pipeline = pipeline(
-                "ner",
-                model=model_name,
-                tokenizer=model_name,
-                aggregation_strategy="simple"  # Merge entities spanning multiple tokens
-            )
+            try:
+                # Use a pre-trained NER model
+                model_name = "dslim/bert-base-NER"  # Good efficient NER model
+                
+                # Use the GPU if there is one, otherwise quantize to INT8 for CPU
+                device = 0 if torch.cuda.is_available() else -1
+                model = AutoModelForTokenClassification.from_pretrained(model_name)
+                model.eval()
+                if device < 0:
+                    model = quantize_model(model)
+                
+                # Initialize NER pipeline with the Rust-backed fast tokenizer
+                self.ner_pipeline = pipeline(
+                    "ner",
+                    model=model,
+                    tokenizer=AutoTokenizer.from_pretrained(model_name, use_fast=True),
+                    aggregation_strategy="simple",  # Merge entities spanning multiple tokens
+                    device=device,
+                    batch_size=16
+                )
+                self.ner_pipeline.model = compile_model(self.ner_pipeline.model)
+                
+                self.initialized = True
+                logger.info("Transformer model for entity extraction loaded successfully")
+            except Exception as e:
+                logger.error("Error initializing transformer model for entity extraction: %s", e)
+                self.initialized = False
             
-            self.initialized = True
-            print("Transformer model for entity extraction loaded successfully")
-        except Exception as e:
-            print(f"Error initializing transformer model for entity extraction: {e}")
-            self.initialized = False
+            self._model_loaded = True
+        
+        return self.initialized
+    
+    def warm_up(self):
+        """Load the fallback NER pipeline and run it once, so the first message doesn't wait for it."""
+        self._run_ner(["Schedule a meeting with John tomorrow at 3pm"])
     
     def extract_entities(self, message, intent=None):
         """
@@ -45,127 +212,244 @@ class EntityExtractor:
         Returns:
             Dict containing extracted entities
         """
-        print(f"Extracting entities from: '{message}'")
+        return self.extract_entities_batch([message], intent)[0]
+    
+    def extract_date_only(self, message):
+        """
+        Extract just a date from a message, as for a reply to "What date?".
+        
+        Runs the rule-based date parser alone and only falls back to full
+        extraction (OpenRouter or NER) when it finds nothing.
+        
+        Args:
+            message: The user message
             
-        # Try OpenRouter first
+        Returns:
+            A date object, or None if no date was found
+        """
+        date = self._extract_datetime(message)["date"]
+        if date is None:
+            date = self.extract_entities(message).get("date")
+        return date
+    
+    def extract_time_only(self, message):
+        """
+        Extract just a time from a message, as for a reply to "What time?".
+        
+        Args:
+            message: The user message
+            
+        Returns:
+            A time object (or time string from OpenRouter), or None if no time was found
+        """
+        time_obj = self._extract_datetime(message)["time"]
+        if time_obj is None:
+            time_obj = self.extract_entities(message).get("time")
+        return time_obj
+    
+    def extract_entities_batch(self, messages, intent=None):
+        """
+        Extract entities from several messages, running NER over them as one batch.
+        
+        Args:
+            messages: List of user messages
+            intent: Intent type (optional, for context-specific extraction)
+            
+        Returns:
+            List of dicts containing extracted entities, one per message
+        """
+        results = [None] * len(messages)
+        
+        # Serve repeated messages from the cache, only extracting the misses
+        minute = get_current_time().replace(second=0, microsecond=0)
+        keys = [(message.strip(), intent, minute) for message in messages]
+        misses = []
+        for i, key in enumerate(keys):
+            entities = self._entity_cache.get(key)
+            if entities is None:
+                misses.append(i)
+            else:
+                results[i] = entities
+        
+        if misses:
+            extracted, cacheable = self._extract_entities_uncached(
+                [keys[i][0] for i in misses], intent
+            )
+            for i, entities, store in zip(misses, extracted, cacheable):
+                if store:
+                    self._entity_cache[keys[i]] = entities
+                results[i] = entities
+        
+        # Copy so callers can't modify the cached results
+        return [
+            {key: list(value) if isinstance(value, list) else value
+             for key, value in entities.items()}
+            for entities in results
+        ]
+    
+    def _extract_entities_uncached(self, messages, intent):
+        """
+        Extract entities from several messages without consulting the cache.
+        
+        Returns:
+            Tuple of (results, cacheable); a local result is not cacheable when
+            OpenRouter is configured, since it only stands in for a failed request
+        """
+        results = [None] * len(messages)
+        
+        # Try OpenRouter first, collecting the messages it couldn't handle
+        pending = []
+        for i, message in enumerate(messages):
+            logger.debug("Extracting entities from: '%s'", message)
+            entities = self._extract_with_openrouter(message, intent)
+            if entities:
+                results[i] = entities
+            else:
+                pending.append(i)
+        
+        # Run NER over all remaining messages in one pipeline call
+        ner_batch = self._run_ner([messages[i] for i in pending])
+        for i, ner_results in zip(pending, ner_batch):
+            results[i] = self._extract_locally(messages[i], intent, ner_results)
+        
+        cacheable = [True] * len(messages)
         if self.openrouter_client.initialized:
-            openrouter_entities = self.openrouter_client.extract_entities(message, intent)
-            if openrouter_entities:
-                print(f"Using OpenRouter entity extraction: {openrouter_entities}")
-                
-                
-                # Process dates if needed
-                if  openrouter_entities.get("date") and isinstance( openrouter_entities["date"], str):
-                    try:
-                         openrouter_entities["date"] = datetime.datetime.strptime(
-                             openrouter_entities["date"], "%Y-%m-%d").date()
-                    except ValueError:
-                        # Try to parse with dateparser if format is different
-                        parsed_date = dateparser.parse( openrouter_entities["date"])
-                        if parsed_date:
-                             openrouter_entities["date"] = parsed_date.date()
-                
-                # Process times if needed
-                if  openrouter_entities.get("time") and isinstance( openrouter_entities["time"], str):
-                    try:
-                         openrouter_entities["time"] = datetime.datetime.strptime(
-                             openrouter_entities["time"], "%H:%M").time()
-                    except ValueError:
-                        # Try to parse with dateparser
-                        parsed_time = dateparser.parse( openrouter_entities["time"])
-                        if parsed_time:
-                             openrouter_entities["time"] = parsed_time.time()
-                
-                return  openrouter_entities
-        
-        # Entities to extract
-        entities = {
-            "person": [],
-            "date": None,
-            "time": None,
-            "duration": None,
-            "email": [],
-            "subject": None,
-            "body": None,
-            "location": None
-        }
-        
-        # Extract with transformer if available
-        if self.initialized:
-            try:
-                # Run NER pipeline
-                ner_results = self.ner_pipeline(message)
-                
-                # Process NER results
-                for entity in ner_results:
-                    entity_text = entity["word"]
-                    entity_type = entity["entity_group"]
-                    
-                    # Map entity types to our structure
-                    if entity_type == "PER" or entity_type == "B-PER":
-                        entities["person"].append(entity_text)
-                        print(f"Found person entity: {entity_text}")
-                    elif entity_type == "LOC" or entity_type == "B-LOC":
-                        entities["location"] = entity_text
-                        print(f"Found location entity: {entity_text}")
-                    elif entity_type == "ORG" or entity_type == "B-ORG":
-                        # Could be used for company/organization meetings
-                        if not entities["location"]:
-                            entities["location"] = entity_text
-                            print(f"Found organization (as location) entity: {entity_text}")
-                
-            except Exception as e:
-                print(f"Error in transformer entity extraction: {e}")
+            for i in pending:
+                cacheable[i] = False
+        
+        return results, cacheable
+    
+    def _extract_with_openrouter(self, message, intent=None):
+        """
+        Extract entities using OpenRouter, converting dates and times to objects.
+        
+        Args:
+            message: The user message
+            intent: Intent type (optional, for context-specific extraction)
+            
+        Returns:
+            Dict containing extracted entities, or None if OpenRouter is unavailable or fails
+        """
+        if not self.openrouter_client.initialized:
+            return None
+        
+        openrouter_entities = self.openrouter_client.extract_entities(message, intent)
+        if not openrouter_entities:
+            return None
+        
+        logger.debug("Using OpenRouter entity extraction: %s", openrouter_entities)
+        
+        # Process dates if needed
+        if openrouter_entities.get("date") and isinstance(openrouter_entities["date"], str):
+            parsed_date = _parse_date_string(openrouter_entities["date"])
+            if parsed_date:
+                openrouter_entities["date"] = parsed_date
+        
+        # Process times if needed
+        if openrouter_entities.get("time") and isinstance(openrouter_entities["time"], str):
+            parsed_time = _parse_time_string(openrouter_entities["time"])
+            if parsed_time:
+                openrouter_entities["time"] = parsed_time
+        
+        return openrouter_entities
+    
+    def _run_ner(self, messages):
+        """
+        Run the NER pipeline over a batch of messages.
+        
+        Args:
+            messages: List of user messages
+            
+        Returns:
+            List of NER results (one list of entity spans per message)
+        """
+        if not messages or not self._ensure_model():
+            return [[] for _ in messages]
+        
+        try:
+            return self.ner_pipeline(messages)
+        except Exception as e:
+            logger.error("Error in transformer entity extraction: %s", e)
+            return [[] for _ in messages]
+    
+    def _extract_locally(self, message, intent, ner_results):
+        """
+        Extract entities from NER results and rule-based patterns.
+        
+        Args:
+            message: The user message
+            intent: Intent type (optional, for context-specific extraction)
+            ner_results: NER pipeline output for this message
+            
+        Returns:
+            Dict containing extracted entities
+        """
+        # Entities to extract (list fields get fresh lists)
+        entities = _ENTITIES_TEMPLATE.copy()
+        entities["person"] = []
+        entities["email"] = []
+        
+        # Process NER results
+        for entity in ner_results:
+            entity_text = entity["word"]
+            
+            # Map entity types to our structure
+            slot = _NER_SLOTS.get(entity["entity_group"])
+            if slot == "person":
+                entities["person"].append(entity_text)
+                logger.info("Found person entity: %s", entity_text)
+            elif slot == "location":
+                entities["location"] = entity_text
+                logger.info("Found location entity: %s", entity_text)
+            elif slot == "location_if_empty":
+                # Could be used for company/organization meetings
+                if not entities["location"]:
+                    entities["location"] = entity_text
+                    logger.info("Found organization (as location) entity: %s", entity_text)
         
         # Extract dates and times
         datetime_entities = self._extract_datetime(message)
         if datetime_entities.get("date"):
-            print(f"Found date entity: {datetime_entities['date']}")
+            logger.info("Found date entity: %s", datetime_entities["date"])
         if datetime_entities.get("time"):
-            print(f"Found time entity: {datetime_entities['time']}")
+            logger.info("Found time entity: %s", datetime_entities["time"])
         
         entities.update(datetime_entities)
         
         # Extract emails
         emails = self._extract_emails(message)
         if emails:
-            print(f"Found email entities: {emails}")
+            logger.info("Found email entities: %s", emails)
         entities["email"] = emails
         
         # Intent-specific extraction
         if intent == "send_email":
             email_entities = self._extract_email_entities(message)
             if email_entities.get("subject"):
-                print(f"Found email subject: {email_entities['subject']}")
+                logger.info("Found email subject: %s", email_entities["subject"])
             if email_entities.get("body"):
-                print(f"Found email body: {email_entities['body']}")
+                logger.info("Found email body: %s", email_entities["body"])
             entities.update(email_entities)
         elif intent == "schedule_meeting":
             meeting_entities = self._extract_meeting_entities(message)
             if meeting_entities.get("location"):
-                print(f"Found meeting location: {meeting_entities['location']}")
+                logger.info("Found meeting location: %s", meeting_entities["location"])
             if meeting_entities.get("subject"):
-                print(f"Found meeting subject: {meeting_entities['subject']}")
+                logger.info("Found meeting subject: %s", meeting_entities["subject"])
             entities.update(meeting_entities)
         
         # If no person entity was found but we're looking for contacts,
         # try to extract names more aggressively
         if not entities["person"] and intent == "find_contact":
-            words = message.split()
-            for i, word in enumerate(words):
-                if word.lower() in ["for", "about", "contact", "information"]:
-                    if i + 1 < len(words) and words[i+1][0].isupper():
-                        name_parts = []
-                        for j in range(i+1, len(words)):
-                            if words[j][0].isupper():
-                                name_parts.append(words[j])
-                            else:
-                                break
-                        if name_parts:
-                            name = " ".join(name_parts)
-                            entities["person"].append(name)
-                            print(f"Found potential person name: {name}")
-                            break
+            for match in _NAME_AFTER_CUE_REGEX.finditer(message):
+                name_parts = list(itertools.takewhile(
+                    lambda word: word[0].isupper(), match.group(1).split()
+                ))
+                if name_parts:
+                    name = " ".join(name_parts)
+                    entities["person"].append(name)
+                    logger.info("Found potential person name: %s", name)
+                    break
         
         return entities
     
@@ -179,28 +463,16 @@ class EntityExtractor:
         Returns:
             Dict containing date, time, and duration entities
         """
-        entities = {
-            "date": None,
-            "time": None,
-            "duration": None
-        }
+        entities = _DATETIME_ENTITIES_TEMPLATE.copy()
         
         # Current time for reference
         now = get_current_time()
         
-        # Try to extract time expressions
-        time_expressions = []
-        
-        # Look for specific time patterns
-        time_pattern = r'\d{1,2}(?::\d{2})?\s*(?:am|pm|AM|PM)?'
-        time_matches = re.finditer(time_pattern, message)
-        
-        for match in time_matches:
-            time_expressions.append(match.group())
+        # Look for a specific time expression (only the first one is used)
+        time_match = _TIME_REGEX.search(message)
         
         # Look for duration patterns
-        duration_pattern = r'(\d+)\s*(hour|minute|min)s?'
-        duration_match = re.search(duration_pattern, message)
+        duration_match = _DURATION_REGEX.search(message)
         
         if duration_match:
             amount = int(duration_match.group(1))
@@ -211,27 +483,30 @@ class EntityExtractor:
             elif unit.startswith('min'):
                 entities["duration"] = amount
         
-        # Use dateparser for more complex date/time extraction
-        parsed_date = dateparser.parse(
-            message,
-            settings={
-                'RELATIVE_BASE': now,
-                'PREFER_DATES_FROM': 'future'
-            }
-        )
+        # Use dateparser for more complex date/time extraction, but only
+        # when the message has something that looks like a date or time
+        parsed_date = None
+        if _DATEISH_REGEX.search(message):
+            parsed_date = dateparser.parse(
+                message,
+                languages=['en'],
+                settings={
+                    'RELATIVE_BASE': now,
+                    'PREFER_DATES_FROM': 'future'
+                }
+            )
         
         if parsed_date:
             # If we have specific time expressions, use the date from parsed_date
             # but keep the time separate
-            if time_expressions:
+            if time_match:
                 entities["date"] = parsed_date.date()
                 
-                # Try to parse the first time expression
-                time_str = time_expressions[0]
-                time_obj = dateparser.parse(time_str)
+                # Try to parse the time expression
+                time_obj = _parse_time_expression(time_match.group())
                 
                 if time_obj:
-                    entities["time"] = time_obj.time()
+                    entities["time"] = time_obj
             else:
                 # Use the full datetime
                 entities["date"] = parsed_date.date()
@@ -249,8 +524,7 @@ class EntityExtractor:
         Returns:
             List of email addresses
         """
-        email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-        return re.findall(email_pattern, message)
+        return _EMAIL_REGEX.findall(message)
     
     def _extract_email_entities(self, message):
         """
@@ -262,36 +536,17 @@ class EntityExtractor:
         Returns:
             Dict containing email-specific entities
         """
-        entities = {
-            "subject": None,
-            "body": None
-        }
+        entities = _EMAIL_ENTITIES_TEMPLATE.copy()
         
         # Look for subject patterns
-        subject_patterns = [
-            r'subject\s*(?:is|:)\s*["\'"]?(.*?)["\'"]?(?:\s|$)',
-            r'about\s*["\'"]?(.*?)["\'"]?(?:\s|$)',
-            r'regarding\s*["\'"]?(.*?)["\'"]?(?:\s|$)'
-        ]
-        
-        for pattern in subject_patterns:
-            match = re.search(pattern, message, re.IGNORECASE)
-            if match:
-                entities["subject"] = match.group(1).strip()
-                break
+        match = _SUBJECT_REGEX.search(message)
+        if match:
+            entities["subject"] = match.group(match.lastgroup).strip()
         
         # Look for body/content patterns
-        body_patterns = [
-            r'body\s*(?:is|:)\s*["\'"]?(.*?)["\'"]?(?:\s|$)',
-            r'content\s*(?:is|:)\s*["\'"]?(.*?)["\'"]?(?:\s|$)',
-            r'message\s*(?:is|:)\s*["\'"]?(.*?)["\'"]?(?:\s|$)'
-        ]
-        
-        for pattern in body_patterns:
-            match = re.search(pattern, message, re.IGNORECASE)
-            if match:
-                entities["body"] = match.group(1).strip()
-                break
+        match = _BODY_REGEX.search(message)
+        if match:
+            entities["body"] = match.group(match.lastgroup).strip()
         
         return entities
     
@@ -305,39 +560,19 @@ class EntityExtractor:
         Returns:
             Dict containing meeting-specific entities
         """
-        entities = {
-            "location": None,
-            "subject": None
-        }
+        entities = _MEETING_ENTITIES_TEMPLATE.copy()
         
         # Look for location patterns
-        location_patterns = [
-            r'(?:at|in)\s+(?:the\s+)?["\'"]?([\w\s]+)["\'"]?(?:\s|$)',
-            r'location\s*(?:is|:)\s*["\'"]?([\w\s]+)["\'"]?(?:\s|$)',
-            r'place\s*(?:is|:)\s*["\'"]?([\w\s]+)["\'"]?(?:\s|$)'
-        ]
-        
-        for pattern in location_patterns:
-            match = re.search(pattern, message, re.IGNORECASE)
-            if match:
-                location = match.group(1).strip()
-                # Exclude common time-related words that might be misidentified as locations
-                if location.lower() not in ['today', 'tomorrow', 'morning', 'afternoon', 'evening', 'night']:
-                    entities["location"] = location
-                    break
+        for match in _LOCATION_REGEX.finditer(message):
+            location = match.group(match.lastgroup).strip()
+            # Exclude common time-related words that might be misidentified as locations
+            if location.lower() not in _TIME_WORDS:
+                entities["location"] = location
+                break
         
         # Look for subject/title patterns
-        subject_patterns = [
-            r'about\s*["\'"]?(.*?)["\'"]?(?:\s|$)',
-            r'regarding\s*["\'"]?(.*?)["\'"]?(?:\s|$)',
-            r'title\s*(?:is|:)\s*["\'"]?(.*?)["\'"]?(?:\s|$)',
-            r'subject\s*(?:is|:)\s*["\'"]?(.*?)["\'"]?(?:\s|$)'
-        ]
-        
-        for pattern in subject_patterns:
-            match = re.search(pattern, message, re.IGNORECASE)
-            if match:
-                entities["subject"] = match.group(1).strip()
-                break
+        match = _MEETING_SUBJECT_REGEX.search(message)
+        if match:
+            entities["subject"] = match.group(match.lastgroup).strip()
         
         return entities
\ No newline at end of file
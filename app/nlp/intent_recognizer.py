@@ -2,10 +2,93 @@
 Intent recognition for user messages using OpenAI and transformer models.
 """
 import re
+import logging
+import threading
 import torch
 import numpy as np
 from transformers import AutoTokenizer, AutoModelForSequenceClassification
-from app.utils.llm import OpenRouterClient
+from app.config import INTENT_ONNX_MODEL_PATH
+from app.nlp.model_utils import compile_model, load_onnx_classifier, quantize_model
+from app.utils.cache import TTLCache
+from app.utils.llm import get_openrouter_client
+
+logger = logging.getLogger(__name__)
+
+# Strong calendar phrasings checked by the quick keyword pass
+_QUICK_CALENDAR_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in [
+    r"what'?s\s+on\s+(?:my\s+)?calendar",
+    r"what\s+is\s+on\s+(?:my\s+)?calendar",
+    r"show\s+(?:my\s+)?calendar",
+    r"check\s+(?:my\s+)?calendar"
+])
+
+# Rule-based patterns - calendar patterns are checked first as they're common
+_CALENDAR_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in [
+    r"what'?s\s+on\s+(?:my\s+)?calendar",
+    r"what\s+is\s+on\s+(?:my\s+)?calendar",
+    r"check\s+(?:my\s+)?calendar",
+    r"show\s+(?:my\s+)?calendar",
+    r"what\s+do\s+i\s+have\s+(?:on|for|scheduled)",
+    r"calendar\s+for\s+today",
+    r"today'?s\s+(?:events|calendar|schedule)",
+    r"my\s+events",
+    r"my\s+schedule",
+    r"my\s+agenda",
+    r"what\s+events",
+    r"any\s+events",
+    r"appointments\s+(?:today|tomorrow|this week)",
+    r"meetings\s+(?:today|tomorrow|this week)",
+])
+
+_EMAIL_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in [
+    r"send\s+(?:an\s+)?email",
+    r"write\s+(?:an\s+)?email",
+    r"email\s+to",
+    r"compose\s+(?:an\s+)?email",
+    r"send\s+(?:a\s+)?message\s+to"
+])
+
+_MEETING_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in [
+    r"schedule\s+(?:a\s+)?meeting",
+    r"set\s+up\s+(?:a\s+)?meeting",
+    r"book\s+(?:a\s+)?meeting",
+    r"arrange\s+(?:a\s+)?meeting",
+    r"plan\s+(?:a\s+)?meeting",
+    r"set\s+(?:a\s+)?appointment"
+])
+
+_CONTACT_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in [
+    r"find\s+contact",
+    r"find\s+(?:the\s+)?email\s+(?:address\s+)?(?:for|of)",
+    r"get\s+contact\s+(?:info|information)",
+    r"look\s+up\s+contact",
+    r"search\s+(?:for\s+)?contact",
+    r"who\s+is",
+    r"contact\s+information",
+    r"contact\s+details"
+])
+
+_FREE_SLOTS_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in [
+    r"find\s+(?:a\s+)?free\s+(?:slot|time)",
+    r"check\s+(?:my\s+)?availability",
+    r"when\s+am\s+i\s+free",
+    r"available\s+(?:slot|time)",
+    r"open\s+(?:slot|time)",
+    r"free\s+time"
+])
+
+def _compile_keyword_scanner(keywords):
+    """Compile keywords into one regex that reports a match at every position."""
+    alternation = "|".join(re.escape(keyword) for keyword in keywords)
+    # Zero-width lookahead so overlapping keywords are all reported in one pass
+    return re.compile(f"(?=({alternation}))")
+
+def _find_keyword(scanner, keywords, text):
+    """Return the highest-priority keyword (dict order) found in text, or None."""
+    found = {match.group(1) for match in scanner.finditer(text)}
+    if not found:
+        return None
+    return next(keyword for keyword in keywords if keyword in found)
 
 class IntentRecognizer:
     # Define intent types
@@ -16,49 +99,143 @@ class IntentRecognizer:
     INTENT_CHECK_FREE_SLOTS = "check_free_slots"
     INTENT_UNKNOWN = "unknown"
     
+    # Quick matches at or above this confidence skip OpenRouter entirely. Only the
+    # calendar phrase patterns reach it; a bare keyword ("meeting", "email") is
+    # too ambiguous to override OpenRouter
+    QUICK_MATCH_CONFIDENCE = 0.95
+    
+    # Hypothesis used for zero-shot classification of each intent label
+    HYPOTHESIS_TEMPLATE = "This text is about {}."
+    
+    # Direct keywords that strongly indicate intents (checked in order)
+    QUICK_KEYWORDS = {
+        "email": INTENT_SEND_EMAIL,
+        "schedule": INTENT_CHECK_CALENDAR,
+        "meeting": INTENT_SCHEDULE_MEETING,
+        "calendar": INTENT_CHECK_CALENDAR,
+        "contact": INTENT_FIND_CONTACT,
+        "free time": INTENT_CHECK_FREE_SLOTS,
+        "availability": INTENT_CHECK_FREE_SLOTS
+    }
+    
+    # Weaker keywords used by the rule-based fallback (checked in order)
+    RULE_KEYWORDS = {
+        "email": INTENT_SEND_EMAIL,
+        "mail": INTENT_SEND_EMAIL,
+        "message": INTENT_SEND_EMAIL,
+        "meeting": INTENT_SCHEDULE_MEETING,
+        "schedule": INTENT_SCHEDULE_MEETING,
+        "appointment": INTENT_SCHEDULE_MEETING,
+        "calendar": INTENT_CHECK_CALENDAR,
+        "events": INTENT_CHECK_CALENDAR,
+        "agenda": INTENT_CHECK_CALENDAR,
+        "contact": INTENT_FIND_CONTACT,
+        "find": INTENT_FIND_CONTACT,
+        "who is": INTENT_FIND_CONTACT,
+        "availability": INTENT_CHECK_FREE_SLOTS,
+        "free time": INTENT_CHECK_FREE_SLOTS,
+        "when am i free": INTENT_CHECK_FREE_SLOTS,
+    }
+    
+    _QUICK_KEYWORD_SCANNER = _compile_keyword_scanner(QUICK_KEYWORDS)
+    _RULE_KEYWORD_SCANNER = _compile_keyword_scanner(RULE_KEYWORDS)
+    
     def __init__(self):
         """Initialize intent recognizers with primary and fallback models."""
-        # Initialize OpenRouter client
-        self.openrouter_client = OpenRouterClient()
+        # Share the process-wide OpenRouter client
+        self.openrouter_client = get_openrouter_client()
         
-        # Initialize fallback transformer model
-        try:
-            # Use a model fine-tuned for intent classification
-            model_name = "facebook/bart-large-mnli"  # Zero-shot classification model
-            self.tokenizer = AutoTokenizer.from_pretrained(model_name)
-            self.model = AutoModelForSequenceClassification.from_pretrained(model_name)
-            
-            # Define intent labels for zero-shot classification
-            self.intent_labels = [
-                "sending an email",
-                "scheduling a meeting",
-                "checking calendar",
-                "finding contact information",
-                "checking availability"
-            ]
-            
-            # Map intent labels to our intent types
-            self.intent_mapping = {
-                "sending an email": self.INTENT_SEND_EMAIL,
-                "scheduling a meeting": self.INTENT_SCHEDULE_MEETING,
-                "checking calendar": self.INTENT_CHECK_CALENDAR,
-                "finding contact information": self.INTENT_FIND_CONTACT,
-                "checking availability": self.INTENT_CHECK_FREE_SLOTS
-            }
+        # Define intent labels for zero-shot classification
+        self.intent_labels = [
+            "sending an email",
+            "scheduling a meeting",
+            "checking calendar",
+            "finding contact information",
+            "checking availability"
+        ]
+        
+        # Map intent labels to our intent types
+        self.intent_mapping = {
+            "sending an email": self.INTENT_SEND_EMAIL,
+            "scheduling a meeting": self.INTENT_SCHEDULE_MEETING,
+            "checking calendar": self.INTENT_CHECK_CALENDAR,
+            "finding contact information": self.INTENT_FIND_CONTACT,
+            "checking availability": self.INTENT_CHECK_FREE_SLOTS
+        }
+        
+        # Fallback transformer model is loaded on first use (see _ensure_model),
+        # since OpenRouter normally answers and the model is large
+        self.tokenizer = None
+        self.model = None
+        self.initialized = False
+        self._model_loaded = False
+        self._model_lock = threading.Lock()
+        
+        # Short replies ("yes", "cancel", ...) repeat constantly, so cache by normalized text
+        self._intent_cache = TTLCache(maxsize=2048, ttl=3600)
+    
+    def _ensure_model(self):
+        """
+        Load the fallback transformer model if it hasn't been loaded yet.
+        
+        Returns:
+            True if the model is available, False otherwise
+        """
+        if self._model_loaded:
+            return self.initialized
+        
+        with self._model_lock:
+            # Another thread may have loaded the model while we waited
+            if self._model_loaded:
+                return self.initialized
             
-            # Initialize model
-            self.model.eval()
+            try:
+                # Use a model fine-tuned for intent classification
+                model_name = "facebook/bart-large-mnli"  # Zero-shot classification model
+                self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+                
+                # Prefer an exported ONNX Runtime model when one is configured
+                self.model = load_onnx_classifier(INTENT_ONNX_MODEL_PATH)
+                if self.model is None:
+                    self.model = AutoModelForSequenceClassification.from_pretrained(model_name)
+                    
+                    # Initialize model and quantize it to INT8 for faster CPU inference
+                    self.model.eval()
+                    self.model = compile_model(quantize_model(self.model))
+                
+                # Tokenize the hypotheses once; only the premise changes per message
+                self._hypothesis_ids = [
+                    self.tokenizer(
+                        self.HYPOTHESIS_TEMPLATE.format(label),
+                        add_special_tokens=False
+                    ).input_ids
+                    for label in self.intent_labels
+                ]
+                self._max_premise_length = (
+                    self.tokenizer.model_max_length
+                    - self.tokenizer.num_special_tokens_to_add(pair=True)
+                    - max(len(ids) for ids in self._hypothesis_ids)
+                )
+                
+                # Set initialization flag
+                self.initialized = True
+                logger.info("Advanced transformer model for intent recognition loaded successfully")
+            except Exception as e:
+                logger.error("Error initializing advanced transformer model: %s", e)
+                self.initialized = False
             
-            # Set initialization flag
-            self.initialized = True
-            print("Advanced transformer model for intent recognition loaded successfully")
-        except Exception as e:
-            print(f"Error initializing advanced transformer model: {e}")
-            self.initialized = False
+            self._model_loaded = True
+        
+        return self.initialized
+    
+    def warm_up(self):
+        """Load the fallback model and run it once, so the first message doesn't wait for it."""
+        if self._ensure_model():
+            self._classify_zero_shot(["What's on my calendar today?"])
     
     def recognize_intent(self, message):
         """
-        Recognize the intent from a user message, using OpenAI first.
+        Recognize the intent from a user message, using local keywords and then OpenRouter.
         
         Args:
             message: The user message
@@ -66,105 +243,195 @@ class IntentRecognizer:
         Returns:
             Dict containing intent type and confidence score
         """
-        """Recognize the intent from a user message, using OpenRouter first."""
-        # Tring OpenRouter first
-        if self.openrouter_client.initialized:
-            result = self.openrouter_client.recognize_intent(message)
-            if result:
-                print(f"OpenRouter predicted intent: {result['intent']} with confidence: {result['confidence']}")
-                return result
+        return self.recognize_intent_batch([message])[0]
+    
+    def recognize_intent_batch(self, messages):
+        """
+        Recognize intents for several messages, running the fallback model over them as one batch.
+        
+        Args:
+            messages: List of user messages
+            
+        Returns:
+            List of dicts containing intent type and confidence score, one per message
+        """
+        results = [None] * len(messages)
+        
+        # Serve repeated messages from the cache. Normalized text is only the
+        # cache key; the classifiers see the message as sent
+        keys = [message.strip().casefold() for message in messages]
+        misses = []
+        for i, key in enumerate(keys):
+            result = self._intent_cache.get(key)
+            if result is None:
+                misses.append(i)
+            else:
+                results[i] = dict(result)
+        
+        if misses:
+            recognized, cacheable = self._recognize_intents([messages[i] for i in misses])
+            for i, result, store in zip(misses, recognized, cacheable):
+                if store:
+                    self._intent_cache[keys[i]] = result
+                results[i] = dict(result)
+        
+        return results
+    
+    def _recognize_intents(self, messages):
+        """
+        Recognize intents for several messages without consulting the cache.
+        
+        Returns:
+            Tuple of (results, cacheable), cacheable being False for each result that
+            only stands in for a failed OpenRouter request or comes from the rule-based fallback
+        """
+        results = [None] * len(messages)
+        cacheable = [True] * len(messages)
+        
+        # Resolve what we can without the model, collecting the rest
+        pending = []
+        for i, message in enumerate(messages):
+            # Resolve obvious requests locally before paying for a network round-trip
+            quick_result = self._check_quick_keywords(message)
+            if quick_result and quick_result["confidence"] >= self.QUICK_MATCH_CONFIDENCE:
+                results[i] = quick_result
+                continue
+            
+            # Try OpenRouter next
+            if self.openrouter_client.initialized:
+                result = self.openrouter_client.recognize_intent(message)
+                if result:
+                    logger.info("OpenRouter predicted intent: %s with confidence: %s", result["intent"], result["confidence"])
+                    results[i] = result
+                    continue
+            
+            # Anything past here is a fallback when OpenRouter should have answered
+            cacheable[i] = not self.openrouter_client.initialized
+            
+            # A keyword hit still beats the fallback model
+            if quick_result:
+                results[i] = quick_result
+                continue
+            
+            if message.strip():
+                pending.append(i)
+            else:
+                results[i] = self._recognize_intent_rule_based(message)
+                cacheable[i] = False
         
         # Fall back to transformer if OpenAI is not available or fails
-        if not self.initialized or not message.strip():
-            return self._recognize_intent_rule_based(message)
+        if pending and self._ensure_model():
+            predictions = self._classify_zero_shot([messages[i] for i in pending])
+        else:
+            predictions = [None] * len(pending)
+        
+        # Fall back to rule-based approach where the model wasn't confident
+        for i, prediction in zip(pending, predictions):
+            if prediction:
+                results[i] = prediction
+            else:
+                results[i] = self._recognize_intent_rule_based(messages[i])
+                cacheable[i] = False
+        
+        return results, cacheable
+    
+    def _classify_zero_shot(self, messages):
+        """
+        Classify messages with the zero-shot model in a single forward pass.
+        
+        Args:
+            messages: List of non-empty user messages
             
-        # Try transformer-based approach
+        Returns:
+            List of dicts containing intent type and confidence score, with None
+            where the model's confidence was too low or inference failed
+        """
         try:
-            # First check if any keywords directly indicate an intent
-            # This helps with very short queries
-            result = self._check_quick_keywords(message)
-            if result:
-                return result
-                
-            # Zero-shot classification approach
-            premise = message
-            hypothesis_template = "This text is about {}."
+            # Zero-shot classification approach: tokenize each premise once
+            # and pair it with each pre-tokenized hypothesis
+            premises = self.tokenizer(messages, add_special_tokens=False).input_ids
             
             # Prepare inputs for the model
-            inputs = self.tokenizer(
-                [premise] * len(self.intent_labels),
-                [hypothesis_template.format(label) for label in self.intent_labels],
-                return_tensors="pt",
-                padding=True,
-                truncation=True
+            inputs = self.tokenizer.pad(
+                {"input_ids": [
+                    self.tokenizer.build_inputs_with_special_tokens(
+                        premise_ids[:self._max_premise_length], hypothesis_ids
+                    )
+                    for premise_ids in premises
+                    for hypothesis_ids in self._hypothesis_ids
+                ]},
+                return_tensors="pt"
             )
             
             # Get model predictions
-            with torch.no_grad():
+            with torch.inference_mode():
                 outputs = self.model(**inputs)
                 predictions = torch.nn.functional.softmax(outputs.logits, dim=1)
                 entailment_idx = 2  # Index for entailment in MNLI model
-                scores = predictions[:, entailment_idx]
-                
-            # Get the best intent and its confidence
-            best_idx = torch.argmax(scores).item()
-            confidence = scores[best_idx].item()
+                scores = predictions[:, entailment_idx].view(len(messages), len(self.intent_labels))
+                best_indices = scores.argmax(dim=1)
+            
+            # Convert to Python floats in a single transfer
+            scores = scores.tolist()
+            best_indices = best_indices.tolist()
+        except Exception as e:
+            logger.error("Error in transformer intent recognition: %s", e)
+            return [None] * len(messages)
+        
+        results = []
+        for message_scores, best_idx in zip(scores, best_indices):
+            confidence = message_scores[best_idx]
             best_intent_label = self.intent_labels[best_idx]
             intent = self.intent_mapping.get(best_intent_label)
             
-            print(f"Zero-shot model predictions:")
-            for i, label in enumerate(self.intent_labels):
-                print(f"  - {label}: {scores[i].item():.4f}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Zero-shot model predictions:")
+                for label, score in zip(self.intent_labels, message_scores):
+                    logger.debug("  - %s: %.4f", label, score)
             
-            # If confidence is too low, fall back to rule-based approach
             if confidence < 0.65:
-                print(f"Low confidence ({confidence:.2f}) from transformer model, falling back to rule-based")
-                return self._recognize_intent_rule_based(message)
-                
-            print(f"Transformer model predicted intent: {intent} with confidence: {confidence:.2f}")
-            return {"intent": intent, "confidence": confidence}
+                logger.info("Low confidence (%.2f) from transformer model, falling back to rule-based", confidence)
+                results.append(None)
+                continue
             
-        except Exception as e:
-            print(f"Error in transformer intent recognition: {e}")
-            # Fall back to rule-based approach
-            return self._recognize_intent_rule_based(message)
+            logger.info("Transformer model predicted intent: %s with confidence: %.2f", intent, confidence)
+            results.append({"intent": intent, "confidence": confidence})
+        
+        return results
     
     def _check_quick_keywords(self, message):
         """Check for strong keywords that clearly indicate an intent."""
-        text = message.lower()
+        match = self._match_quick_keywords(message.lower())
+        if not match:
+            # No quick matches found
+            return None
         
-        # Direct keywords that strongly indicate intents
-        direct_mappings = {
-            "email": self.INTENT_SEND_EMAIL,
-            "schedule": self.INTENT_SCHEDULE_MEETING,
-            "meeting": self.INTENT_SCHEDULE_MEETING,
-            "calendar": self.INTENT_CHECK_CALENDAR,
-            "schedule": self.INTENT_CHECK_CALENDAR,
-            "contact": self.INTENT_FIND_CONTACT,
-            "free time": self.INTENT_CHECK_FREE_SLOTS,
-            "availability": self.INTENT_CHECK_FREE_SLOTS
-        }
+        intent, confidence = match
+        return {"intent": intent, "confidence": confidence}
+    
+    @staticmethod
+    def _match_quick_keywords(text):
+        """
+        Match lowercased text against the quick calendar patterns and keywords.
         
+        Returns:
+            (intent, confidence) tuple or None if nothing matched
+        """
         # Check specific patterns for calendar queries
-        calendar_patterns = [
-            r"what'?s\s+on\s+(?:my\s+)?calendar",
-            r"what\s+is\s+on\s+(?:my\s+)?calendar",
-            r"show\s+(?:my\s+)?calendar",
-            r"check\s+(?:my\s+)?calendar"
-        ]
-        
-        for pattern in calendar_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                print(f"Detected calendar intent via quick pattern match")
-                return {"intent": self.INTENT_CHECK_CALENDAR, "confidence": 0.95}
+        for pattern in _QUICK_CALENDAR_PATTERNS:
+            if pattern.search(text):
+                logger.info("Detected calendar intent via quick pattern match")
+                return (IntentRecognizer.INTENT_CHECK_CALENDAR, 0.95)
         
         # Check for direct keyword matches
-        for keyword, intent in direct_mappings.items():
-            if keyword in text:
-                print(f"Detected intent via direct keyword '{keyword}': {intent}")
-                return {"intent": intent, "confidence": 0.9}
+        keyword = _find_keyword(
+            IntentRecognizer._QUICK_KEYWORD_SCANNER, IntentRecognizer.QUICK_KEYWORDS, text
+        )
+        if keyword:
+            intent = IntentRecognizer.QUICK_KEYWORDS[keyword]
+            logger.info("Detected intent via direct keyword '%s': %s", keyword, intent)
+            return (intent, 0.9)
         
-        # No quick matches found
         return None
     
     def _recognize_intent_rule_based(self, message):
@@ -177,7 +444,7 @@ class IntentRecognizer:
         Returns:
             Dict containing intent type and confidence score
         """
-        print("Using rule-based intent recognition")
+        logger.debug("Using rule-based intent recognition")
         
         if not message.strip():
             return {"intent": self.INTENT_UNKNOWN, "confidence": 0.0}
@@ -185,112 +452,35 @@ class IntentRecognizer:
         # Convert to lowercase for matching
         text = message.lower()
         
-        # Enhanced patterns for better matching
-        
         # Calendar patterns - Check these first as they're common
-        calendar_patterns = [
-            r"what'?s\s+on\s+(?:my\s+)?calendar",
-            r"what\s+is\s+on\s+(?:my\s+)?calendar",
-            r"check\s+(?:my\s+)?calendar",
-            r"show\s+(?:my\s+)?calendar",
-            r"what\s+do\s+i\s+have\s+(?:on|for|scheduled)",
-            r"calendar\s+for\s+today",
-            r"today'?s\s+(?:events|calendar|schedule)",
-            r"my\s+events",
-            r"my\s+schedule",
-            r"my\s+agenda",
-            r"what\s+events",
-            r"any\s+events",
-            r"appointments\s+(?:today|tomorrow|this week)",
-            r"meetings\s+(?:today|tomorrow|this week)",
-        ]
-        
-        if any(re.search(pattern, text) for pattern in calendar_patterns):
-            print("Detected calendar checking intent")
+        if any(pattern.search(text) for pattern in _CALENDAR_PATTERNS):
+            logger.info("Detected calendar checking intent")
             return {"intent": self.INTENT_CHECK_CALENDAR, "confidence": 0.9}
         
-        # Email patterns
-        email_patterns = [
-            r"send\s+(?:an\s+)?email",
-            r"write\s+(?:an\s+)?email",
-            r"email\s+to",
-            r"compose\s+(?:an\s+)?email",
-            r"send\s+(?:a\s+)?message\s+to"
-        ]
-        
-        # Meeting patterns
-        meeting_patterns = [
-            r"schedule\s+(?:a\s+)?meeting",
-            r"set\s+up\s+(?:a\s+)?meeting",
-            r"book\s+(?:a\s+)?meeting",
-            r"arrange\s+(?:a\s+)?meeting",
-            r"plan\s+(?:a\s+)?meeting",
-            r"set\s+(?:a\s+)?appointment"
-        ]
-        
-        # Contact patterns
-        contact_patterns = [
-            r"find\s+contact",
-            r"find\s+(?:the\s+)?email\s+(?:address\s+)?(?:for|of)",
-            r"get\s+contact\s+(?:info|information)",
-            r"look\s+up\s+contact",
-            r"search\s+(?:for\s+)?contact",
-            r"who\s+is",
-            r"contact\s+information",
-            r"contact\s+details"
-        ]
-        
-        # Free slots patterns
-        free_slots_patterns = [
-            r"find\s+(?:a\s+)?free\s+(?:slot|time)",
-            r"check\s+(?:my\s+)?availability",
-            r"when\s+am\s+i\s+free",
-            r"available\s+(?:slot|time)",
-            r"open\s+(?:slot|time)",
-            r"free\s+time"
-        ]
-        
         # Check for each intent with regex patterns
-        if any(re.search(pattern, text) for pattern in email_patterns):
-            print("Detected email intent")
+        if any(pattern.search(text) for pattern in _EMAIL_PATTERNS):
+            logger.info("Detected email intent")
             return {"intent": self.INTENT_SEND_EMAIL, "confidence": 0.9}
         
-        if any(re.search(pattern, text) for pattern in meeting_patterns):
-            print("Detected meeting intent")
+        if any(pattern.search(text) for pattern in _MEETING_PATTERNS):
+            logger.info("Detected meeting intent")
             return {"intent": self.INTENT_SCHEDULE_MEETING, "confidence": 0.9}
         
-        if any(re.search(pattern, text) for pattern in contact_patterns):
-            print("Detected contact finding intent")
+        if any(pattern.search(text) for pattern in _CONTACT_PATTERNS):
+            logger.info("Detected contact finding intent")
             return {"intent": self.INTENT_FIND_CONTACT, "confidence": 0.9}
         
-        if any(re.search(pattern, text) for pattern in free_slots_patterns):
-            print("Detected free slots checking intent")
+        if any(pattern.search(text) for pattern in _FREE_SLOTS_PATTERNS):
+            logger.info("Detected free slots checking intent")
             return {"intent": self.INTENT_CHECK_FREE_SLOTS, "confidence": 0.9}
         
         # Fall back to keyword matching
-        keywords = {
-            "email": self.INTENT_SEND_EMAIL,
-            "mail": self.INTENT_SEND_EMAIL,
-            "message": self.INTENT_SEND_EMAIL,
-            "meeting": self.INTENT_SCHEDULE_MEETING,
-            "schedule": self.INTENT_SCHEDULE_MEETING,
-            "appointment": self.INTENT_SCHEDULE_MEETING,
-            "calendar": self.INTENT_CHECK_CALENDAR,
-            "events": self.INTENT_CHECK_CALENDAR,
-            "agenda": self.INTENT_CHECK_CALENDAR,
-            "contact": self.INTENT_FIND_CONTACT,
-            "find": self.INTENT_FIND_CONTACT,
-            "who is": self.INTENT_FIND_CONTACT,
-            "availability": self.INTENT_CHECK_FREE_SLOTS,
-            "free time": self.INTENT_CHECK_FREE_SLOTS,
-            "when am i free": self.INTENT_CHECK_FREE_SLOTS,
-        }
-        
-        for keyword, intent in keywords.items():
-            if keyword in text:
-                print(f"Detected intent via keyword '{keyword}': {intent}")
-                return {"intent": intent, "confidence": 0.7}
+        keyword = _find_keyword(self._RULE_KEYWORD_SCANNER, self.RULE_KEYWORDS, text)
+        if keyword:
+            intent = self.RULE_KEYWORDS[keyword]
+            logger.info("Detected intent via keyword '%s': %s", keyword, intent)
+            return {"intent": intent, "confidence": 0.7}
         
         # Default to unknown intent with low confidence
-        print("No intent detected, returning unknown")
+        logger.info("No intent detected, returning unknown")
         return {"intent": self.INTENT_UNKNOWN, "confidence": 0.3}
\ No newline at end of file
@@ -0,0 +1,94 @@
+"""
+Utilities for optimizing the fallback transformer models for CPU inference.
+"""
+import logging
+import torch
+from app.config import COMPILE_MODELS, QUANTIZE_MODELS
+
+# ONNX Runtime support is optional
+try:
+    from optimum.onnxruntime import ORTModelForSequenceClassification
+except ImportError:
+    ORTModelForSequenceClassification = None
+
+logger = logging.getLogger(__name__)
+
+def quantize_model(model):
+    """
+    Apply INT8 dynamic quantization to the Linear layers of a model.
+    
+    Args:
+        model: A PyTorch model in eval mode
+        
+    Returns:
+        The quantized model, or the original model if quantization is
+        disabled or not supported on this platform
+    """
+    if not QUANTIZE_MODELS:
+        return model
+    
+    # fbgemm targets x86, qnnpack targets ARM
+    supported_engines = torch.backends.quantized.supported_engines
+    if "fbgemm" in supported_engines:
+        torch.backends.quantized.engine = "fbgemm"
+    elif "qnnpack" in supported_engines:
+        torch.backends.quantized.engine = "qnnpack"
+    else:
+        logger.warning("No INT8 quantization engine available, using FP32 model")
+        return model
+    
+    try:
+        return torch.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+    except Exception as e:
+        logger.warning("Error quantizing model, using FP32 model: %s", e)
+        return model
+
+def compile_model(model):
+    """
+    Compile a PyTorch model with torch.compile when COMPILE_MODELS is enabled.
+    
+    Compilation happens on the first forward pass, so callers should warm the
+    model up before serving requests.
+    
+    Args:
+        model: A PyTorch model in eval mode
+        
+    Returns:
+        The compiled model, or the original model if compilation is disabled
+        or not supported
+    """
+    if not COMPILE_MODELS or not hasattr(torch, "compile"):
+        return model
+    
+    try:
+        return torch.compile(model, dynamic=True)
+    except Exception as e:
+        logger.warning("Error compiling model, using eager model: %s", e)
+        return model
+
+def load_onnx_classifier(model_path):
+    """
+    Load an exported ONNX sequence classifier with ONNX Runtime.
+    
+    Args:
+        model_path: Directory containing the exported (optionally INT8-quantized) model
+        
+    Returns:
+        The ONNX Runtime model, or None if no path is configured or loading fails
+    """
+    if not model_path:
+        return None
+    
+    if ORTModelForSequenceClassification is None:
+        logger.warning("optimum[onnxruntime] is not installed, ignoring ONNX model at %s", model_path)
+        return None
+    
+    try:
+        return ORTModelForSequenceClassification.from_pretrained(
+            model_path, provider="CPUExecutionProvider"
+        )
+    except Exception as e:
+        logger.warning("Error loading ONNX model from %s, using PyTorch model: %s", model_path, e)
+        return None
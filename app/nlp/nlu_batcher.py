@@ -0,0 +1,93 @@
+"""
+Micro-batching of intent recognition and entity extraction across concurrent messages.
+"""
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+logger = logging.getLogger(__name__)
+
+class NLUBatcher:
+    def __init__(self, intent_recognizer, entity_extractor, max_batch_size=16, max_wait=0.02):
+        """
+        Start the background worker that groups messages into batches.
+        
+        Args:
+            intent_recognizer: IntentRecognizer used for the batched intent pass
+            entity_extractor: EntityExtractor used for the batched entity pass
+            max_batch_size: Maximum number of messages processed together
+            max_wait: Seconds to wait for more messages after the first one arrives
+        """
+        self.intent_recognizer = intent_recognizer
+        self.entity_extractor = entity_extractor
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        
+        self._queue = queue.Queue()
+        self._worker = threading.Thread(target=self._run, name="nlu-batcher", daemon=True)
+        self._worker.start()
+    
+    def process(self, message):
+        """
+        Recognize the intent of a message and extract its entities.
+        
+        Blocks until the batch containing the message has been processed.
+        
+        Args:
+            message: The user message
+        
+        Returns:
+            Tuple of (intent_data, entities), as returned by recognize_intent
+            and extract_entities
+        """
+        future = Future()
+        self._queue.put((message, future))
+        return future.result()
+    
+    def _run(self):
+        """Collect messages arriving within max_wait of each other and process them together."""
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_wait
+            
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+            
+            self._process_batch(batch)
+    
+    def _process_batch(self, batch):
+        """Run intent recognition and entity extraction over a batch, resolving each future."""
+        messages = [message for message, _ in batch]
+        logger.debug("Processing NLU batch of %d messages", len(messages))
+        
+        try:
+            intents = self.intent_recognizer.recognize_intent_batch(messages)
+            
+            # Entity extraction depends on the intent, so batch messages that share one
+            indices_by_intent = {}
+            for i, intent_data in enumerate(intents):
+                indices_by_intent.setdefault(intent_data["intent"], []).append(i)
+            
+            entities = [None] * len(messages)
+            for intent, indices in indices_by_intent.items():
+                batch_entities = self.entity_extractor.extract_entities_batch(
+                    [messages[i] for i in indices], intent
+                )
+                for i, message_entities in zip(indices, batch_entities):
+                    entities[i] = message_entities
+        except Exception as e:
+            logger.error("Error processing NLU batch: %s", e)
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        
+        for (_, future), intent_data, message_entities in zip(batch, intents, entities):
+            future.set_result((intent_data, message_entities))
@@ -2,25 +2,107 @@
 Calendar service for managing events using Google Calendar API.
 """
 import datetime
-import pytz
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from zoneinfo import ZoneInfo
 from googleapiclient.errors import HttpError
 
-from app.utils.auth import get_calendar_service
+from app.utils.auth import get_calendar_service, get_authorized_http, get_google_credentials
+from app.utils.rate_limiter import RateLimiter
 from app.utils.helpers import (
     format_datetime, 
     format_date, 
     format_time,
-    create_time_slot_range,
     get_weekday_name,
-    get_current_time
+    get_current_time,
+    parse_iso_datetime
 )
-from app.config import TIME_ZONE
+from app.config import GOOGLE_CALENDAR_RATE_LIMIT, TIME_ZONE
+
+# Configured timezone, built once per process
+_TIMEZONE = ZoneInfo(TIME_ZONE)
+
+# Google Calendar accepts at most 50 requests per batch
+MAX_BATCH_SIZE = 50
+
+# Keeps Calendar API calls under the per-user quota instead of retrying after 403/429s
+_rate_limiter = RateLimiter(GOOGLE_CALENDAR_RATE_LIMIT)
+
+# Runs batches concurrently when a call needs more than one
+_batch_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="calendar-batch")
+
+# Partial-response mask covering the event fields read by _format_event and get_next_event
+EVENT_LIST_FIELDS = "items(id,summary,start,end,description,location,htmlLink),nextPageToken"
+
+# get_events output keys, each with the event resource field it's read from
+_EVENT_FIELDS = {
+    'id': ('id', lambda event: event['id']),
+    'summary': ('summary', lambda event: event.get('summary', 'No Title')),
+    'start': ('start', lambda event: event['start'].get('dateTime', event['start'].get('date'))),
+    'end': ('end', lambda event: event['end'].get('dateTime', event['end'].get('date'))),
+    'description': ('description', lambda event: event.get('description', '')),
+    'location': ('location', lambda event: event.get('location', '')),
+    'link': ('htmlLink', lambda event: event.get('htmlLink', '')),
+}
+
+def _event_list_mask(fields):
+    """Return the events.list partial-response mask for a tuple of get_events keys."""
+    if fields is None:
+        return EVENT_LIST_FIELDS
+    return "items(%s),nextPageToken" % ",".join(_EVENT_FIELDS[key][0] for key in fields)
+
+# Process-wide Calendar API client, so discovery and build() run only once
+_service = None
+_credentials = None
+_service_lock = threading.Lock()
+
+def _shared_service():
+    """Return the shared Calendar API client and its credentials, building them on first use."""
+    global _service, _credentials
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                # Left as None on failure so the next caller retries
+                credentials = get_google_credentials()
+                if credentials:
+                    _credentials = credentials
+                    _service = get_calendar_service(credentials)
+    return _service, _credentials
+
+# Working-hours strings such as '9:00' or '17:30'
+_HOUR_MINUTE_REGEX = re.compile(r"^(\d{1,2}):(\d{2})$")
+
+def _parse_hour_minute(value):
+    """Parse an 'HH:MM' string into a time object."""
+    match = _HOUR_MINUTE_REGEX.match(value)
+    if not match:
+        raise ValueError(f"Invalid time string: {value!r}")
+    return datetime.time(int(match.group(1)), int(match.group(2)))
+
+def _slot_epoch_range(day_start_ts, day_end_ts, step):
+    """Return the start epochs of the step-second slots that fit between two epochs."""
+    return np.arange(day_start_ts, day_end_ts - step + 1, step, dtype=np.int64)
 
 class CalendarService:
+    _instance = None
+    _instance_lock = threading.Lock()
+    
+    @classmethod
+    def instance(cls):
+        """Return the process-wide CalendarService, creating it on first use."""
+        # Rebuilt while the API client is unavailable so authentication is retried
+        if cls._instance is None or not cls._instance.service:
+            with cls._instance_lock:
+                if cls._instance is None or not cls._instance.service:
+                    cls._instance = cls()
+        return cls._instance
+    
     def __init__(self):
         """Initialize the calendar service with Google Calendar API."""
-        self.service = get_calendar_service()
-        self.timezone = pytz.timezone(TIME_ZONE)
+        self.service, self.credentials = _shared_service()
+        self.timezone = _TIMEZONE
         if not self.service:
             print("Failed to initialize Calendar service")
     
@@ -44,10 +126,64 @@ class CalendarService:
         if not self.service:
             return {"success": False, "error": "Calendar service not initialized"}
         
+        try:
+            _rate_limiter.acquire()
+            event = self._insert_event_request(
+                summary, start_time, end_time, description,
+                location, attendees, send_notifications
+            ).execute()
+            
+            return {
+                "success": True,
+                "event_id": event.get('id'),
+                "html_link": event.get('htmlLink')
+            }
+            
+        except HttpError as error:
+            return {"success": False, "error": f"Calendar API error: {error}"}
+        except Exception as e:
+            return {"success": False, "error": f"Error creating event: {e}"}
+    
+    def create_events_batch(self, events):
+        """
+        Create several calendar events in a single batched HTTP request.
+        
+        Args:
+            events: List of dicts with the keyword arguments accepted by create_event
+            
+        Returns:
+            List of result dicts (same shape as create_event), one per event
+        """
+        if not self.service:
+            return [{"success": False, "error": "Calendar service not initialized"} for _ in events]
+        
+        def to_result(response, exception):
+            if exception is not None:
+                return {"success": False, "error": f"Calendar API error: {exception}"}
+            return {
+                "success": True,
+                "event_id": response.get('id'),
+                "html_link": response.get('htmlLink')
+            }
+        
+        try:
+            api_requests = [self._insert_event_request(**event) for event in events]
+            return self._execute_batch(api_requests, to_result)
+        except Exception as e:
+            return [{"success": False, "error": f"Error creating events: {e}"} for _ in events]
+    
+    def _insert_event_request(self, summary, start_time, end_time, description=None, 
+                              location=None, attendees=None, send_notifications=True):
+        """
+        Build (but don't execute) an events.insert request.
+        
+        start_time/end_time are matched by exact type, so they must be plain
+        datetime objects or ISO format strings (not datetime subclasses).
+        """
         # Convert datetime objects to strings if needed
-        if isinstance(start_time, datetime.datetime):
+        if type(start_time) is datetime.datetime:
             start_time = start_time.isoformat()
-        if isinstance(end_time, datetime.datetime):
+        if type(end_time) is datetime.datetime:
             end_time = end_time.isoformat()
         
         # Prepare event data
@@ -73,26 +209,54 @@ class CalendarService:
             if isinstance(attendees, str):
                 attendees = [attendees]
             event['attendees'] = [{'email': email} for email in attendees]
+        
+        return self.service.events().insert(
+            calendarId='primary',
+            body=event,
+            sendUpdates='all' if send_notifications else 'none'
+        )
+    
+    def _execute_batch(self, requests, to_result):
+        """
+        Execute API requests as batched HTTP requests, preserving order.
+        
+        Args:
+            requests: List of unexecuted API requests
+            to_result: Function (response, exception) -> result for each request
             
-        try:
-            event = self.service.events().insert(
-                calendarId='primary',
-                body=event,
-                sendUpdates='all' if send_notifications else 'none'
-            ).execute()
-            
-            return {
-                "success": True,
-                "event_id": event.get('id'),
-                "html_link": event.get('htmlLink')
-            }
+        Returns:
+            List of results in the same order as requests
+        """
+        results = [None] * len(requests)
+        
+        def callback(request_id, response, exception):
+            results[int(request_id)] = to_result(response, exception)
+        
+        def run_batch(offset, http=None):
+            batch = self.service.new_batch_http_request(callback=callback)
+            chunk = requests[offset:offset + MAX_BATCH_SIZE]
+            for i, request in enumerate(chunk, offset):
+                batch.add(request, request_id=str(i))
             
-        except HttpError as error:
-            return {"success": False, "error": f"Calendar API error: {error}"}
-        except Exception as e:
-            return {"success": False, "error": f"Error creating event: {e}"}
+            # Each request in a batch counts against the quota
+            _rate_limiter.acquire(len(chunk))
+            batch.execute(http=http)
+        
+        offsets = range(0, len(requests), MAX_BATCH_SIZE)
+        if len(offsets) <= 1:
+            for offset in offsets:
+                run_batch(offset)
+        else:
+            # httplib2 connections aren't thread-safe, so each worker sends its
+            # batch over its own thread's connection with the same credentials
+            list(_batch_executor.map(
+                lambda offset: run_batch(offset, get_authorized_http(self.credentials)),
+                offsets
+            ))
+        
+        return results
     
-    def get_events(self, start_date=None, end_date=None, max_results=10):
+    def get_events(self, start_date=None, end_date=None, max_results=10, fields=None):
         """
         Get events from the calendar.
         
@@ -100,6 +264,8 @@ class CalendarService:
             start_date: Start date (datetime object, date object, or ISO format string)
             end_date: End date (datetime object, date object, or ISO format string)
             max_results: Maximum number of events to retrieve
+            fields: Optional tuple of event keys to return (e.g. ('start', 'summary'));
+                only these are requested from the API. Defaults to all keys.
             
         Returns:
             List of event objects
@@ -107,87 +273,134 @@ class CalendarService:
         if not self.service:
             return []
         
+        try:
+            _rate_limiter.acquire()
+            events_result = self._list_events_request(
+                start_date, end_date, max_results, fields
+            ).execute()
+            
+            return [self._format_event(event, fields) for event in events_result.get('items', [])]
+            
+        except HttpError as error:
+            print(f"Calendar API error: {error}")
+            return []
+        except Exception as e:
+            print(f"Error getting events: {e}")
+            return []
+    
+    def get_events_batch(self, date_ranges, max_results=10, fields=None):
+        """
+        Get events for several date ranges in a single batched HTTP request.
+        
+        Args:
+            date_ranges: List of (start_date, end_date) tuples, as accepted by get_events
+            max_results: Maximum number of events to retrieve per range
+            fields: Optional tuple of event keys to return, as accepted by get_events
+            
+        Returns:
+            List of event lists, one per date range
+        """
+        if not self.service:
+            return [[] for _ in date_ranges]
+        
+        def to_result(response, exception):
+            if exception is not None:
+                print(f"Calendar API error: {exception}")
+                return []
+            return [self._format_event(event, fields) for event in response.get('items', [])]
+        
+        try:
+            api_requests = [
+                self._list_events_request(start_date, end_date, max_results, fields)
+                for start_date, end_date in date_ranges
+            ]
+            return self._execute_batch(api_requests, to_result)
+        except Exception as e:
+            print(f"Error getting events: {e}")
+            return [[] for _ in date_ranges]
+    
+    def _list_events_request(self, start_date=None, end_date=None, max_results=10, fields=None):
+        """Build (but don't execute) an events.list request for a date range."""
         # Set default dates if not provided
         if not start_date:
             start_date = get_current_time().date()
         
         if not end_date:
-            if isinstance(start_date, datetime.date) and not isinstance(start_date, datetime.datetime):
+            start_type = type(start_date)
+            if start_type is datetime.date:
                 end_date = start_date + datetime.timedelta(days=1)
-            elif isinstance(start_date, datetime.datetime):
+            elif start_type is datetime.datetime:
                 end_date = start_date + datetime.timedelta(minutes=30)
             else:
                 # Assume it's an ISO string
                 try:
                     # Try to parse it
-                    dt = datetime.datetime.fromisoformat(start_date.replace('Z', '+00:00'))
+                    dt = parse_iso_datetime(start_date)
                     end_date = (dt + datetime.timedelta(minutes=30)).isoformat()
                 except Exception:
                     # Fall back to 1 day from now
                     end_date = (get_current_time() + datetime.timedelta(days=1)).isoformat()
         
         # Format dates for API
-        if isinstance(start_date, datetime.date) and not isinstance(start_date, datetime.datetime):
-            time_min = datetime.datetime.combine(start_date, datetime.time.min)
-            time_min = self.timezone.localize(time_min).isoformat()
-        elif isinstance(start_date, datetime.datetime):
-            # Make sure it's timezone-aware
-            if start_date.tzinfo is None:
-                time_min = self.timezone.localize(start_date).isoformat()
-            else:
-                time_min = start_date.isoformat()
-        else:
-            # Assume it's already in ISO format
-            time_min = start_date
+        time_min = self._to_api_iso(start_date)
+        time_max = self._to_api_iso(end_date, end_of_day=True)
         
-        if isinstance(end_date, datetime.date) and not isinstance(end_date, datetime.datetime):
-            time_max = datetime.datetime.combine(end_date, datetime.time.max)
-            time_max = self.timezone.localize(time_max).isoformat()
-        elif isinstance(end_date, datetime.datetime):
-            # Make sure it's timezone-aware
-            if end_date.tzinfo is None:
-                time_max = self.timezone.localize(end_date).isoformat()
-            else:
-                time_max = end_date.isoformat()
-        else:
-            # Assume it's already in ISO format
-            time_max = end_date
+        return self.service.events().list(
+            calendarId='primary',
+            timeMin=time_min,
+            timeMax=time_max,
+            maxResults=max_results,
+            singleEvents=True,
+            orderBy='startTime',
+            timeZone=TIME_ZONE,
+            fields=_event_list_mask(fields)
+        )
+    
+    def _to_api_iso(self, value, end_of_day=False):
+        """
+        Format a date bound for the API as a timezone-aware ISO string.
         
-        try:
-            events_result = self.service.events().list(
-                calendarId='primary',
-                timeMin=time_min,
-                timeMax=time_max,
-                maxResults=max_results,
-                singleEvents=True,
-                orderBy='startTime'
-            ).execute()
-            
-            events = events_result.get('items', [])
+        Args:
+            value: date, datetime (naive ones use the configured timezone) or ISO string
+            end_of_day: For a date, use the end of the day (next midnight) instead of its start
             
-            formatted_events = []
-            for event in events:
-                start = event['start'].get('dateTime', event['start'].get('date'))
-                end = event['end'].get('dateTime', event['end'].get('date'))
-                
-                formatted_events.append({
-                    'id': event['id'],
-                    'summary': event.get('summary', 'No Title'),
-                    'start': start,
-                    'end': end,
-                    'description': event.get('description', ''),
-                    'location': event.get('location', ''),
-                    'link': event.get('htmlLink', '')
-                })
-                
-            return formatted_events
+        Returns:
+            ISO format string
             
-        except HttpError as error:
-            print(f"Calendar API error: {error}")
-            return []
-        except Exception as e:
-            print(f"Error getting events: {e}")
-            return []
+        Dates are matched by exact type with a single pointer compare, so
+        subclasses of date/datetime are not expected here.
+        """
+        value_type = type(value)
+        if value_type is datetime.date:
+            # timeMax is exclusive, so the end of a day is the next day's midnight
+            if end_of_day:
+                value += datetime.timedelta(days=1)
+            return datetime.datetime(value.year, value.month, value.day, tzinfo=self.timezone).isoformat()
+        if value_type is datetime.datetime:
+            # Make sure it's timezone-aware
+            if value.tzinfo is None:
+                value = value.replace(tzinfo=self.timezone)
+            return value.isoformat()
+        # Assume it's already in ISO format
+        return value
+    
+    def _format_event(self, event, fields=None):
+        """Convert an API event resource into the dict returned by get_events."""
+        if fields is not None:
+            return {key: _EVENT_FIELDS[key][1](event) for key in fields}
+        
+        start = event['start'].get('dateTime', event['start'].get('date'))
+        end = event['end'].get('dateTime', event['end'].get('date'))
+        
+        return {
+            'id': event['id'],
+            'summary': event.get('summary', 'No Title'),
+            'start': start,
+            'end': end,
+            'description': event.get('description', ''),
+            'location': event.get('location', ''),
+            'link': event.get('htmlLink', '')
+        }
     
     def get_free_slots(self, date, start_time=None, end_time=None, duration_minutes=30):
         """
@@ -202,96 +415,228 @@ class CalendarService:
         Returns:
             List of available time slots as (start, end) datetime tuples
         """
+        return self.get_free_slots_for_dates(
+            [date], start_time, end_time, duration_minutes
+        )[0]
+    
+    def get_free_slots_for_dates(self, dates, start_time=None, end_time=None, duration_minutes=30):
+        """
+        Find free time slots on several dates, fetching their events in one batch.
+        
+        Args:
+            dates: List of dates to check (date objects or ISO format strings)
+            start_time: Start of working hours (time object or string, default: 9:00)
+            end_time: End of working hours (time object or string, default: 17:00)
+            duration_minutes: Duration of each slot in minutes
+            
+        Returns:
+            List of free slot lists, one per date, each as (start, end) datetime tuples
+        """
         if not self.service:
-            return []
+            return [[] for _ in dates]
         
         # Set default times if not provided
         if not start_time:
             start_time = datetime.time(9, 0)  # 9:00 AM
         elif isinstance(start_time, str):
             # Parse time string (format: HH:MM)
-            hour, minute = map(int, start_time.split(':'))
-            start_time = datetime.time(hour, minute)
+            start_time = _parse_hour_minute(start_time)
             
         if not end_time:
             end_time = datetime.time(17, 0)  # 5:00 PM
         elif isinstance(end_time, str):
             # Parse time string (format: HH:MM)
-            hour, minute = map(int, end_time.split(':'))
-            end_time = datetime.time(hour, minute)
+            end_time = _parse_hour_minute(end_time)
         
-        # Convert date string to date object if needed
-        if isinstance(date, str):
-            date = datetime.datetime.strptime(date, "%Y-%m-%d").date()
+        # Create datetime objects for start and end of each day
+        day_ranges = []
+        for date in dates:
+            # Convert date string to date object if needed
+            if isinstance(date, str):
+                date = datetime.date.fromisoformat(date)
+            
+            day_start = datetime.datetime.combine(date, start_time)
+            day_start = day_start.replace(tzinfo=self.timezone)
+            
+            day_end = datetime.datetime.combine(date, end_time)
+            day_end = day_end.replace(tzinfo=self.timezone)
+            
+            day_ranges.append((day_start, day_end))
+        
+        # Get busy periods for all days in one batched request
+        busy_per_day = self.get_busy_periods_batch(day_ranges)
+        
+        return [
+            self._find_free_slots(day_start, day_end, busy_periods, duration_minutes)
+            for (day_start, day_end), busy_periods in zip(day_ranges, busy_per_day)
+        ]
+    
+    def get_busy_periods_batch(self, time_ranges):
+        """
+        Get busy periods on the primary calendar for several time ranges.
+        
+        Uses freebusy.query, which returns only busy intervals instead of
+        full event resources.
         
-        # Create datetime objects for start and end of the day
-        day_start = datetime.datetime.combine(date, start_time)
-        day_start = self.timezone.localize(day_start)
+        Args:
+            time_ranges: List of (start, end) timezone-aware datetime tuples
+            
+        Returns:
+            List of busy period lists, one per range, each a list of
+            dicts with 'start' and 'end' ISO format strings
+        """
+        if not self.service:
+            return [[] for _ in time_ranges]
+        
+        def to_result(response, exception):
+            if exception is not None:
+                print(f"Calendar API error: {exception}")
+                return []
+            return response.get('calendars', {}).get('primary', {}).get('busy', [])
+        
+        try:
+            api_requests = [
+                self._freebusy_request(time_min, time_max)
+                for time_min, time_max in time_ranges
+            ]
+            return self._execute_batch(api_requests, to_result)
+        except Exception as e:
+            print(f"Error getting free/busy information: {e}")
+            return [[] for _ in time_ranges]
+    
+    def _freebusy_request(self, time_min, time_max):
+        """Build (but don't execute) a freebusy.query request for the primary calendar."""
+        return self.service.freebusy().query(body={
+            'timeMin': time_min.isoformat(),
+            'timeMax': time_max.isoformat(),
+            'timeZone': TIME_ZONE,
+            'items': [{'id': 'primary'}]
+        })
+    
+    def check_availability(self, start_dt, end_dt, day_start, day_end, duration_minutes=30):
+        """
+        Check a time range for conflicting events and find the free slots around it,
+        using a single freebusy query for both.
+        
+        Args:
+            start_dt: Start of the requested time (timezone-aware datetime)
+            end_dt: End of the requested time (timezone-aware datetime)
+            day_start: Start of the window to search for free slots (timezone-aware datetime)
+            day_end: End of the window to search for free slots (timezone-aware datetime)
+            duration_minutes: Duration of each free slot in minutes
+            
+        Returns:
+            Tuple of (has_conflict, free_slots), free_slots being (start, end) datetime tuples
+        """
+        if not self.service:
+            return False, []
         
-        day_end = datetime.datetime.combine(date, end_time)
-        day_end = self.timezone.localize(day_end)
+        try:
+            # Cover both the requested time and the window so one query answers
+            # both; freebusy skips transparent events, as the free slots should
+            _rate_limiter.acquire()
+            freebusy_result = self._freebusy_request(
+                min(day_start, start_dt), max(day_end, end_dt)
+            ).execute()
+        except HttpError as error:
+            # Assume no conflicts on error
+            print(f"Calendar API error: {error}")
+            return False, []
+        except Exception as e:
+            print(f"Error checking availability: {e}")
+            return False, []
         
-        # Get all slots for the day
-        all_slots = create_time_slot_range(day_start, day_end, duration_minutes)
+        busy_periods = freebusy_result.get('calendars', {}).get('primary', {}).get('busy', [])
         
-        # Get events for the day
-        events = self.get_events(
-            start_date=day_start,
-            end_date=day_end
+        has_conflict = any(
+            parse_iso_datetime(period['start']) < end_dt and parse_iso_datetime(period['end']) > start_dt
+            for period in busy_periods
         )
+        free_slots = self._find_free_slots(day_start, day_end, busy_periods, duration_minutes)
+        
+        return has_conflict, free_slots
+    
+    def _find_free_slots(self, day_start, day_end, busy_periods, duration_minutes):
+        """
+        Find the slots between day_start and day_end that don't overlap a busy period.
         
-        # Mark busy slots
-        busy_slots = []
-        for event in events:
-            event_start = event['start']
-            event_end = event['end']
+        Args:
+            day_start: Start of the window (timezone-aware datetime)
+            day_end: End of the window (timezone-aware datetime)
+            busy_periods: Dicts with 'start' and 'end' (ISO strings or datetimes)
+            duration_minutes: Duration of each slot in minutes
+            
+        Returns:
+            List of available time slots as (start, end) datetime tuples
+        """
+        day_start_ts = int(day_start.timestamp())
+        day_end_ts = int(day_end.timestamp())
+        
+        # Mark busy slots as epoch seconds; only instants are compared, so aware
+        # datetimes need no conversion to the local timezone first
+        busy_starts = []
+        busy_ends = []
+        for period in busy_periods:
+            event_start = period['start']
+            event_end = period['end']
             
             # Convert to datetime objects if they are strings
             if isinstance(event_start, str):
-                event_start = datetime.datetime.fromisoformat(event_start.replace('Z', '+00:00'))
-                event_start = event_start.astimezone(self.timezone)
+                event_start = parse_iso_datetime(event_start)
                 
             if isinstance(event_end, str):
-                event_end = datetime.datetime.fromisoformat(event_end.replace('Z', '+00:00'))
-                event_end = event_end.astimezone(self.timezone)
+                event_end = parse_iso_datetime(event_end)
             
-            # Add to busy slots
-            busy_slots.append((event_start, event_end))
+            busy_start_ts = int(event_start.timestamp())
+            busy_end_ts = int(event_end.timestamp())
+            
+            # A busy period covering the whole window leaves nothing free
+            if busy_start_ts <= day_start_ts and busy_end_ts >= day_end_ts:
+                return []
+            
+            busy_starts.append(busy_start_ts)
+            busy_ends.append(busy_end_ts)
+        
+        # Get all slots for the day as epoch seconds
+        step = int(duration_minutes * 60)
+        slot_starts = _slot_epoch_range(day_start_ts, day_end_ts, step)
         
-        # Find free slots
-        free_slots = []
-        for slot_start, slot_end in all_slots:
-            is_free = True
+        # With no busy periods every slot is free, so skip the overlap pass
+        if busy_starts:
+            slot_ends = slot_starts + step
+            busy_starts = np.array(busy_starts, dtype=np.int64)
+            busy_ends = np.array(busy_ends, dtype=np.int64)
             
-            for busy_start, busy_end in busy_slots:
-                # Check if slot overlaps with any busy period
-                if (slot_start < busy_end and slot_end > busy_start):
-                    is_free = False
-                    break
+            # Sort busy periods by start and track the latest end seen so far
+            order = np.argsort(busy_starts, kind='stable')
+            busy_starts = busy_starts[order]
+            latest_ends = np.maximum.accumulate(busy_ends[order])
             
-            if is_free:
-                free_slots.append((slot_start, slot_end))
+            # The busy periods starting before a slot ends are busy_starts[:k]; the slot
+            # overlaps one of them if the latest of their ends is after the slot starts
+            k = np.searchsorted(busy_starts, slot_ends, side='left')
+            overlaps = (k > 0) & (latest_ends[np.maximum(k - 1, 0)] > slot_starts)
+            slot_starts = slot_starts[~overlaps]
         
-        return free_slots
+        # Only build datetimes for the slots that are free
+        fromtimestamp = datetime.datetime.fromtimestamp
+        return [
+            (fromtimestamp(start, self.timezone), fromtimestamp(start + step, self.timezone))
+            for start in slot_starts.tolist()
+        ]
     
-    def format_free_slots(self, free_slots):
+    def format_free_slots(self, free_slots, prefix=""):
         """
         Format free slots for display.
         
         Args:
             free_slots: List of (start, end) datetime tuples
+            prefix: Text to put before each slot (e.g. an emoji)
             
         Returns:
             List of formatted time slot strings
         """
-        formatted_slots = []
-        
-        for start, end in free_slots:
-            start_time = format_time(start)
-            end_time = format_time(end)
-            formatted_slots.append(f"{start_time} - {end_time}")
-        
-        return formatted_slots
+        return [f"{prefix}{format_time(start)} - {format_time(end)}" for start, end in free_slots]
     
     def get_next_event(self):
         """
@@ -306,12 +651,15 @@ class CalendarService:
         now = get_current_time().isoformat()
         
         try:
+            _rate_limiter.acquire()
             events_result = self.service.events().list(
                 calendarId='primary',
                 timeMin=now,
                 maxResults=1,
                 singleEvents=True,
-                orderBy='startTime'
+                orderBy='startTime',
+                timeZone=TIME_ZONE,
+                fields=EVENT_LIST_FIELDS
             ).execute()
             
             events = events_result.get('items', [])
@@ -322,14 +670,13 @@ class CalendarService:
             event = events[0]
             start = event['start'].get('dateTime', event['start'].get('date'))
             
-            # Convert to datetime object if it's a string
+            # Convert to datetime object if it's a string (the API already
+            # returns it in the configured timezone)
             if isinstance(start, str):
                 if 'T' in start:  # It's a datetime
-                    start_dt = datetime.datetime.fromisoformat(start.replace('Z', '+00:00'))
+                    start_dt = parse_iso_datetime(start)
                 else:  # It's a date
-                    start_dt = datetime.datetime.strptime(start, "%Y-%m-%d")
-                    
-                start_dt = start_dt.astimezone(self.timezone)
+                    start_dt = datetime.datetime.fromisoformat(start)
             else:
                 start_dt = start
                 
@@ -17,6 +17,10 @@ class ContactsDBService:
         self.db_path = os.path.join(BASE_DIR, 'contacts.db')
         self.initialized = self._initialize_db()
         
+        # Contacts by normalized name, so exact-name lookups skip SQLite
+        self._by_name = {}
+        self._load_name_index()
+        
     def _initialize_db(self):
         """Create the database and tables if they don't exist."""
         try:
@@ -51,6 +55,37 @@ class ContactsDBService:
             print(f"Error initializing contacts database: {e}")
             return False
     
+    def _load_name_index(self):
+        """Load every contact into the in-memory name index."""
+        if not self.initialized:
+            return
+        
+        try:
+            conn = sqlite3.connect(self.db_path)
+            rows = conn.execute('SELECT id, name, email, phone FROM contacts').fetchall()
+            conn.close()
+        except Exception as e:
+            print(f"Error loading contacts name index: {e}")
+            return
+        
+        by_name = {}
+        for resource_name, name, email, phone in rows:
+            key = normalize_name(name)
+            if not key or key in by_name:
+                continue
+            
+            contact_data = {
+                'resource_name': resource_name,
+                'name': name,
+                'match_quality': 'database match'
+            }
+            if email: contact_data['email'] = email
+            if phone: contact_data['phone'] = phone
+            by_name[key] = contact_data
+        
+        # Swap in the new index in one assignment so readers never see a partial one
+        self._by_name = by_name
+    
     def sync_contacts(self, google_contacts_service, resume_from=None):
         """
         Sync contacts from Google to local database with resumption capability.
@@ -215,6 +250,7 @@ class ContactsDBService:
                         
                         # Commit what we have so far
                         conn.commit()
+                        self._load_name_index()
                         
                         # Store sync state for resuming
                         if resume_point:
@@ -233,6 +269,7 @@ class ContactsDBService:
                 conn.commit()
             
             conn.close()
+            self._load_name_index()
             
             print(f"Successfully synced {contact_count} contacts to local database")
             return {"success": True, "contacts_synced": contact_count, "complete": True}
@@ -309,6 +346,11 @@ class ContactsDBService:
     def get_contact_by_name(self, name):
         """Get a contact by name from local database."""
         print(f"Looking up contact by name in local DB: {name}")
+        contact = self._by_name.get(normalize_name(name))
+        if contact:
+            return dict(contact)
+        
+        # Fall back to substring and full-text search
         contacts = self.search_contacts(name, max_results=1)
         return contacts[0] if contacts else None
     
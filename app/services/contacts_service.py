@@ -13,8 +13,19 @@ class ContactsService:
         if not self.service:
             print("Failed to initialize Contacts service")
     
-    def search_contacts(self, query, max_results=10):
-        """Improved contact search with strict matching and pagination support"""
+    def search_contacts(self, query, max_results=10, include_details=False):
+        """
+        Improved contact search with strict matching and pagination support.
+        
+        Args:
+            query: Name to search for
+            max_results: Maximum number of contacts to return
+            include_details: Also fetch addresses and organizations and attach each
+                match's full details (as get_contact_details returns them) under 'details'
+            
+        Returns:
+            List of matching contact dicts, best matches first
+        """
         if not self.service:
             return []
             
@@ -23,6 +34,10 @@ class ContactsService:
             original_query = query  # Store original query for exact matching
             normalized_query = normalize_name(query)
             
+            person_fields = 'names,emailAddresses,phoneNumbers'
+            if include_details:
+                person_fields += ',addresses,organizations'
+            
             # Get ALL contacts with pagination
             connections = []
             next_page_token = None
@@ -32,7 +47,7 @@ class ContactsService:
                 results = self.service.people().connections().list(
                     resourceName='people/me',
                     pageSize=1000,  # Maximum page size
-                    personFields='names,emailAddresses,phoneNumbers',
+                    personFields=person_fields,
                     pageToken=next_page_token,
                     sortOrder='LAST_MODIFIED_DESCENDING'
                 ).execute()
@@ -129,6 +144,9 @@ class ContactsService:
                 if primary_phone: 
                     contact_data['phone'] = primary_phone
                 
+                if include_details:
+                    contact_data['details'] = self._person_details(person)
+                
                 if primary_email or primary_phone:
                     match_tier.append(contact_data)
             
@@ -176,56 +194,68 @@ class ContactsService:
                 personFields='names,emailAddresses,phoneNumbers,addresses,organizations'
             ).execute()
             
-            # Extract information
-            names = person.get('names', [])
-            emails = person.get('emailAddresses', [])
-            phones = person.get('phoneNumbers', [])
-            addresses = person.get('addresses', [])
-            organizations = person.get('organizations', [])
-            
-            # Get primary values
-            name = next((name.get('displayName') for name in names 
-                          if name.get('metadata', {}).get('primary', False)), 
-                         names[0].get('displayName') if names else 'No Name')
-            
-            # Always include all emails, not just primary
-            all_emails = [email.get('value') for email in emails if email.get('value')]
-            email = all_emails[0] if all_emails else None
-            
-            # Always include all phone numbers, not just primary
-            all_phones = [phone.get('value') for phone in phones if phone.get('value')]
-            phone = all_phones[0] if all_phones else None
-            
-            address = next((address.get('formattedValue') for address in addresses 
-                             if address.get('metadata', {}).get('primary', False)), 
-                            addresses[0].get('formattedValue') if addresses else None)
-            
-            organization = next((org.get('name') for org in organizations 
-                                 if org.get('metadata', {}).get('primary', False)), 
-                                organizations[0].get('name') if organizations else None)
-            
-            # Include all emails and phones in the result
-            result = {
-                'resource_name': person.get('resourceName'),
-                'name': name,
-                'email': email,
-                'phone': phone,
-                'address': address,
-                'organization': organization
-            }
-            
-            # Add all emails and phones
-            if len(all_emails) > 1:
-                result['all_emails'] = all_emails
-            
-            if len(all_phones) > 1:
-                result['all_phones'] = all_phones
-                
-            return result
+            return self._person_details(person)
             
         except HttpError as error:
             print(f"People API error: {error}")
             return None
         except Exception as e:
             print(f"Error getting contact details: {e}")
-            return None
\ No newline at end of file
+            return None
+    
+    def _person_details(self, person):
+        """
+        Extract contact details from a People API person resource.
+        
+        Args:
+            person: Person resource with names, emails, phones, addresses and organizations
+            
+        Returns:
+            Dict containing contact details
+        """
+        # Extract information
+        names = person.get('names', [])
+        emails = person.get('emailAddresses', [])
+        phones = person.get('phoneNumbers', [])
+        addresses = person.get('addresses', [])
+        organizations = person.get('organizations', [])
+        
+        # Get primary values
+        name = next((name.get('displayName') for name in names 
+                      if name.get('metadata', {}).get('primary', False)), 
+                     names[0].get('displayName') if names else 'No Name')
+        
+        # Always include all emails, not just primary
+        all_emails = [email.get('value') for email in emails if email.get('value')]
+        email = all_emails[0] if all_emails else None
+        
+        # Always include all phone numbers, not just primary
+        all_phones = [phone.get('value') for phone in phones if phone.get('value')]
+        phone = all_phones[0] if all_phones else None
+        
+        address = next((address.get('formattedValue') for address in addresses 
+                         if address.get('metadata', {}).get('primary', False)), 
+                        addresses[0].get('formattedValue') if addresses else None)
+        
+        organization = next((org.get('name') for org in organizations 
+                             if org.get('metadata', {}).get('primary', False)), 
+                            organizations[0].get('name') if organizations else None)
+        
+        # Include all emails and phones in the result
+        result = {
+            'resource_name': person.get('resourceName'),
+            'name': name,
+            'email': email,
+            'phone': phone,
+            'address': address,
+            'organization': organization
+        }
+        
+        # Add all emails and phones
+        if len(all_emails) > 1:
+            result['all_emails'] = all_emails
+        
+        if len(all_phones) > 1:
+            result['all_phones'] = all_phones
+            
+        return result
@@ -4,9 +4,13 @@ Handles OAuth2 flow for Gmail, Calendar, and Contacts APIs.
 """
 import os
 import pickle
+import threading
+import httplib2
 from google.auth.transport.requests import Request
+from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
+from googleapiclient.http import HttpRequest
 
 from app.config import (
     GOOGLE_CREDENTIALS_PATH,
@@ -15,16 +19,39 @@ from app.config import (
     APPLICATION_NAME
 )
 
-def get_google_service(api_name, api_version):
+# httplib2 keeps connections alive per Http object but isn't thread-safe,
+# so each thread sends its requests over its own Http (see _request_builder)
+_thread_local = threading.local()
+
+def _get_http():
+    """Returns this thread's shared httplib2.Http, creating it on first use."""
+    http = getattr(_thread_local, 'http', None)
+    if http is None:
+        http = _thread_local.http = httplib2.Http(timeout=60)
+    return http
+
+def get_authorized_http(credentials):
+    """Returns an authorized Http for credentials, backed by this thread's connections."""
+    return AuthorizedHttp(credentials, http=_get_http())
+
+def _request_builder(credentials):
     """
-    Authenticates with Google and returns a service object for the specified API.
+    Returns a requestBuilder for build() that binds each request to the Http of
+    the thread creating it, instead of the Http the service was built with.
+    
+    Services are shared across threads, so requests must not all go through the
+    building thread's connection.
+    """
+    def build_request(http, *args, **kwargs):
+        return HttpRequest(get_authorized_http(credentials), *args, **kwargs)
+    return build_request
+
+def get_google_credentials():
+    """
+    Loads the saved Google credentials, refreshing them or running the OAuth flow as needed.
     
-    Args:
-        api_name: The name of the Google API (e.g., 'gmail', 'calendar', 'people')
-        api_version: The version of the API (e.g., 'v1', 'v3')
-        
     Returns:
-        A service object for the specified API or None if authentication fails
+        Credentials object or None if authentication fails
     """
     creds = None
     
@@ -50,9 +77,32 @@ def get_google_service(api_name, api_version):
         with open(GOOGLE_TOKEN_PATH, 'wb') as token:
             pickle.dump(creds, token)
     
+    return creds
+
+def get_google_service(api_name, api_version, credentials=None):
+    """
+    Authenticates with Google and returns a service object for the specified API.
+    
+    Args:
+        api_name: The name of the Google API (e.g., 'gmail', 'calendar', 'people')
+        api_version: The version of the API (e.g., 'v1', 'v3')
+        credentials: Credentials to use (optional, loaded with get_google_credentials by default)
+        
+    Returns:
+        A service object for the specified API or None if authentication fails
+    """
+    creds = credentials or get_google_credentials()
+    if not creds:
+        return None
+    
     # Build and return the service
     try:
-        service = build(api_name, api_version, credentials=creds)
+        service = build(
+            api_name, api_version,
+            http=get_authorized_http(creds),
+            requestBuilder=_request_builder(creds),
+            static_discovery=True
+        )
         return service
     except Exception as e:
         print(f"Error building {api_name} service: {e}")
@@ -62,9 +112,9 @@ def get_gmail_service():
     """Returns an authenticated Gmail service."""
     return get_google_service('gmail', 'v1')
 
-def get_calendar_service():
+def get_calendar_service(credentials=None):
     """Returns an authenticated Calendar service."""
-    return get_google_service('calendar', 'v3')
+    return get_google_service('calendar', 'v3', credentials)
 
 def get_contacts_service():
     """Returns an authenticated People (Contacts) service."""
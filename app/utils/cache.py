@@ -0,0 +1,58 @@
+"""
+Small in-process caches.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+class TTLCache:
+    def __init__(self, maxsize, ttl):
+        """
+        Initialize an LRU cache whose entries also expire after a fixed time.
+        
+        Args:
+            maxsize: Maximum number of entries; the least recently used is evicted first
+            ttl: Seconds an entry stays valid after it is stored
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key, default=None):
+        """Return the cached value for key, or default if it is missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            
+            expires, value = entry
+            if expires <= time.monotonic():
+                del self._entries[key]
+                return default
+            
+            self._entries.move_to_end(key)
+            return value
+    
+    def __setitem__(self, key, value):
+        self.set(key, value)
+    
+    def set(self, key, value, ttl=None):
+        """
+        Store a value, optionally with its own lifetime.
+        
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Seconds this entry stays valid (defaults to the cache's ttl)
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
@@ -3,13 +3,35 @@ Helper utilities for the AI assistant.
 Provides common functions used across the application.
 """
 import datetime
-import pytz
 import re
+import sys
+from zoneinfo import ZoneInfo
 from app.config import TIME_ZONE
 
+# Configured timezone, built once per process
+_TIMEZONE = ZoneInfo(TIME_ZONE)
+
+# Parse RFC 3339 / ISO 8601 strings such as '2024-05-01T10:00:00Z' into aware datetimes.
+# ciso8601 is a C parser that accepts 'Z' and is the fastest option when installed;
+# otherwise Python 3.11+ fromisoformat accepts 'Z' natively.
+try:
+    from ciso8601 import parse_datetime as parse_iso_datetime
+except ImportError:
+    if sys.version_info >= (3, 11):
+        parse_iso_datetime = datetime.datetime.fromisoformat
+    else:
+        def parse_iso_datetime(value):
+            """Parse an ISO 8601 datetime string, accepting a 'Z' UTC suffix."""
+            if value.endswith('Z'):
+                value = value[:-1] + '+00:00'
+            return datetime.datetime.fromisoformat(value)
+
+# Basic email address format, compiled once
+_EMAIL_REGEX = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
 def get_current_time():
     """Returns the current time in the configured timezone."""
-    return datetime.datetime.now(pytz.timezone(TIME_ZONE))
+    return datetime.datetime.now(_TIMEZONE)
 
 def format_datetime(dt, format_str="%Y-%m-%d %H:%M:%S"):
     """Formats a datetime object as a string."""
@@ -19,17 +41,14 @@ def format_datetime(dt, format_str="%Y-%m-%d %H:%M:%S"):
 
 def format_date(dt, format_str="%Y-%m-%d"):
     """Formats a date as a string."""
-    if isinstance(dt, datetime.datetime):
-        return dt.strftime(format_str)
-    elif isinstance(dt, datetime.date):
+    # datetime is a subclass of date, so one check covers both
+    if isinstance(dt, datetime.date):
         return dt.strftime(format_str)
     return dt
 
 def format_time(dt, format_str="%H:%M"):
     """Formats a time as a string."""
-    if isinstance(dt, datetime.datetime):
-        return dt.strftime(format_str)
-    elif isinstance(dt, datetime.time):
+    if isinstance(dt, (datetime.datetime, datetime.time)):
         return dt.strftime(format_str)
     elif callable(dt):  # Check if it's a function
         return str(dt)  # Convert function to string instead of calling .upper()
@@ -43,8 +62,7 @@ def is_valid_email(email):
         tuple: (is_valid, error_message, suggestion)
     """
     # Basic format check with regex
-    email_regex = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    is_valid = bool(re.match(email_regex, email))
+    is_valid = _EMAIL_REGEX.match(email) is not None
     
     if is_valid:
         return True, None, None
@@ -120,29 +138,6 @@ def normalize_name(name):
     # Convert to lowercase and remove extra spaces
     return " ".join(name.lower().split())
 
-def create_time_slot_range(start_time, end_time, duration_minutes=30):
-    """
-    Creates a list of time slots between start_time and end_time.
-    
-    Args:
-        start_time: The start time as a datetime object
-        end_time: The end time as a datetime object
-        duration_minutes: The duration of each slot in minutes
-        
-    Returns:
-        A list of (start, end) tuples for each time slot
-    """
-    slots = []
-    slot_start = start_time
-    
-    while slot_start < end_time:
-        slot_end = slot_start + datetime.timedelta(minutes=duration_minutes)
-        if slot_end <= end_time:
-            slots.append((slot_start, slot_end))
-        slot_start = slot_end
-        
-    return slots
-
 def get_weekday_name(date):
     """Returns the name of the weekday for a given date."""
     weekdays = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
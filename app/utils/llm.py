@@ -2,9 +2,23 @@
 LLM utilities for intent recognition and entity extraction using OpenRouter API.
 """
 import json
+import threading
 import requests
 from app.config import OPENROUTER_API_KEY, OPENROUTER_URL
 
+# Process-wide client shared by the intent recognizer and entity extractor
+_client = None
+_client_lock = threading.Lock()
+
+def get_openrouter_client():
+    """Return the shared OpenRouterClient, creating it on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = OpenRouterClient()
+    return _client
+
 class OpenRouterClient:
     def __init__(self):
         """Initialize the OpenRouter client for LLM access."""
@@ -13,6 +27,13 @@ class OpenRouterClient:
         self.model = "openai/gpt-4o-mini"     # Using GPT-4o-mini through OpenRouter
         self.initialized = self.api_key is not None
         
+        # Reuse one HTTP session so requests share pooled keep-alive connections
+        self.session = requests.Session()
+        self.session.headers.update({
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        })
+        
         if not self.initialized:
             print("OpenRouter API key not found. LLM features will fall back to transformer models.")
     
@@ -33,11 +54,6 @@ class OpenRouterClient:
             
             Return ONLY the intent, nothing else."""
             
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
             payload = {
                 "model": self.model,
                 "messages": [{"role": "user", "content": prompt}],
@@ -45,7 +61,7 @@ class OpenRouterClient:
                 "max_tokens": 15
             }
             
-            response = requests.post(self.api_url, json=payload, headers=headers)
+            response = self.session.post(self.api_url, json=payload)
             response.raise_for_status()
             result = response.json()
             
@@ -94,11 +110,6 @@ class OpenRouterClient:
             
             Return ONLY valid JSON, nothing else."""
             
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
             payload = {
                 "model": self.model,
                 "messages": [{"role": "user", "content": prompt}],
@@ -106,7 +117,7 @@ class OpenRouterClient:
                 "max_tokens": 400
             }
             
-            response = requests.post(self.api_url, json=payload, headers=headers)
+            response = self.session.post(self.api_url, json=payload)
             response.raise_for_status()
             result = response.json()
             
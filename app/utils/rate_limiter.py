@@ -0,0 +1,40 @@
+"""
+Client-side rate limiting for external API calls.
+"""
+import threading
+import time
+
+class RateLimiter:
+    def __init__(self, rate, capacity=None):
+        """
+        Initialize a token bucket that refills continuously.
+        
+        Args:
+            rate: Requests allowed per second on average
+            capacity: Maximum burst size (defaults to one second's worth of requests)
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self, tokens=1):
+        """
+        Block until the given number of requests may be sent.
+        
+        Tokens are reserved before waiting, so concurrent callers are served
+        in the order they arrive and a large batch simply waits longer.
+        
+        Args:
+            tokens: Number of requests about to be sent
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        
+        if wait > 0:
+            time.sleep(wait)
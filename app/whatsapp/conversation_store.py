@@ -0,0 +1,88 @@
+"""
+Per-user conversation state with expiry of abandoned conversations.
+"""
+import datetime
+import threading
+import time
+from dataclasses import dataclass, field
+from app.config import CONVERSATION_TTL_MINUTES
+
+@dataclass(slots=True)
+class ConversationState:
+    """State of one user's multi-step conversation (an email or a meeting)."""
+    type: str
+    step: str
+    
+    # Email fields
+    recipient: str | None = None
+    subject: str | None = None
+    body: str | None = None
+    
+    # Meeting fields
+    person: str | None = None
+    suggested_email: str | None = None
+    date: datetime.date | None = None
+    time: datetime.time | None = None
+    end_time: datetime.time | None = None
+    duration: int | None = None
+    location: str | None = None
+    description: str | None = None
+    alternative_slots: list = field(default_factory=list)
+    resolved_name: str | None = None
+    resolved_email: str | None = None
+
+class ConversationStore:
+    def __init__(self, ttl_seconds=CONVERSATION_TTL_MINUTES * 60):
+        """
+        Initialize an empty conversation store.
+        
+        Args:
+            ttl_seconds: Seconds of inactivity after which a conversation is dropped
+        """
+        self.ttl_seconds = ttl_seconds
+        self._states = {}
+        self._touched = {}
+        self._lock = threading.Lock()
+    
+    def _expire(self, from_number, now):
+        """Drop the conversation for a user if it has been idle too long. Caller holds the lock."""
+        touched = self._touched.get(from_number)
+        if touched is not None and now - touched > self.ttl_seconds:
+            del self._states[from_number]
+            del self._touched[from_number]
+    
+    def __contains__(self, from_number):
+        with self._lock:
+            self._expire(from_number, time.monotonic())
+            return from_number in self._states
+    
+    def __getitem__(self, from_number):
+        with self._lock:
+            now = time.monotonic()
+            self._expire(from_number, now)
+            state = self._states[from_number]
+            self._touched[from_number] = now
+            return state
+    
+    def __setitem__(self, from_number, state):
+        with self._lock:
+            self._states[from_number] = state
+            self._touched[from_number] = time.monotonic()
+    
+    def __delitem__(self, from_number):
+        with self._lock:
+            del self._states[from_number]
+            del self._touched[from_number]
+    
+    def get(self, from_number, default=None):
+        """Return the state for a user, or default if there is no ongoing conversation."""
+        try:
+            return self[from_number]
+        except KeyError:
+            return default
+    
+    def pop(self, from_number, default=None):
+        """Remove and return the state for a user, or default if there is none."""
+        with self._lock:
+            self._touched.pop(from_number, None)
+            return self._states.pop(from_number, default)
@@ -2,43 +2,186 @@
 Handler for WhatsApp messages with intent-based processing.
 """
 import datetime
-import traceback
-import pytz
-from app.config import TIME_ZONE
+import functools
+import logging
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from zoneinfo import ZoneInfo
+from app.config import TIME_ZONE, WARMUP_MODELS
 
 from app.nlp.intent_recognizer import IntentRecognizer
 from app.nlp.entity_extractor import EntityExtractor
+from app.nlp.nlu_batcher import NLUBatcher
 from app.services.email_service import EmailService
 from app.services.calendar_service import CalendarService
 from app.services.contacts_service import ContactsService
 from app.services.contacts_db_service import ContactsDBService
-from app.utils.helpers import format_date, format_time, get_current_time, is_valid_email
+from app.whatsapp.conversation_store import ConversationState, ConversationStore
+from app.utils.cache import TTLCache
+from app.utils.helpers import format_date, format_time, get_current_time, is_valid_email, parse_iso_datetime
+
+logger = logging.getLogger(__name__)
+
+# Configured timezone, built once per process
+_TIMEZONE = ZoneInfo(TIME_ZONE)
+
+# Single-word replies to the bot's own prompts; these never start a new request
+_CONTROL_WORDS = frozenset({"yes", "y", "no", "n", "cancel", "sure", "ok", "send", "1", "2", "3", "4", "5"})
+
+# Accepted replies to the bot's yes/no prompts
+_AFFIRM = frozenset({"yes", "y", "sure", "ok", "send"})
+_AFFIRM_BOOKING = frozenset({"yes", "y", "sure", "ok", "book", "1"})
+_DENY = frozenset({"no", "n", "nope", "cancel"})
+_CONFIRM_EMAIL = frozenset({"yes", "y", "correct", "confirm", "right"})
+
+# Everything after the first word that introduces the contact name in a "find contact" request
+_CONTACT_NAME_REGEX = re.compile(
+    r"(?<!\S)(?:for|about|contact|email|address|phone)\s+(\S.*)", re.IGNORECASE | re.DOTALL
+)
+
+# Marks a contact cache miss, since None is cached for names with no contact
+_MISSING = object()
+
+# Names with no contact are remembered briefly, so a newly added contact is found soon
+_CONTACT_NOT_FOUND_TTL = 30
+
+# Days of events fetched at once for calendar queries, and how long they're reused
+_CALENDAR_PREFETCH_DAYS = 7
+_CALENDAR_CACHE_TTL = 60
+
+# Events returned for a single day, as get_events does by default
+_MAX_EVENTS_PER_DAY = 10
+
+# Twilio's limit on the body of a single WhatsApp message
+_MAX_MESSAGE_LENGTH = 1600
+
+# "today", "today's" or "todays" as a whole word
+_TODAY_REGEX = re.compile(r"\btoday(?:'?s)?\b", re.IGNORECASE)
+
+# Runs independent lookups (e.g. contacts) alongside calendar requests
+_io_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="message-io")
+
+# Sends replies in the background when enabled. Each recipient always maps to the same
+# single-threaded executor, so one user's replies arrive in order
+_send_executors = tuple(
+    ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"whatsapp-send-{i}") for i in range(4)
+)
+
+# Runs local contacts DB lookups alongside Google Contacts requests. Kept separate
+# from _io_executor, whose tasks wait on these lookups
+_contact_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="contact-lookup")
+
+# Calendar reply templates, bound once: the headers take a date label, each
+# event line an event's formatted time and summary
+_format_events_header = "📅 Events for {}:\n\n".format
+_format_free_slots_header = "📅 Free 30-minute slots for {}:\n\n".format
+_format_event_line = "🕒 {} - {}".format
+
+def _event_bound(value):
+    """Convert an event start or end (RFC 3339 datetime or all-day date string) to an aware datetime."""
+    if 'T' in value:
+        return parse_iso_datetime(value)
+    return datetime.datetime.combine(datetime.date.fromisoformat(value), datetime.time(), tzinfo=_TIMEZONE)
 
 class MessageHandler:
-    def __init__(self, whatsapp_client):
+    def __init__(self, whatsapp_client, background_send=False):
         """
         Initialize the message handler.
         
         Args:
             whatsapp_client: WhatsApp client instance for sending responses
+            background_send: Send responses on background threads instead of
+                waiting for each send to finish
         """
         self.whatsapp_client = whatsapp_client
+        self.background_send = background_send
         self.intent_recognizer = IntentRecognizer()
         self.entity_extractor = EntityExtractor()
-        self.email_service = EmailService()
-        self.calendar_service = CalendarService()
-        self.contacts_service = ContactsService()
         
-        # Initialize local contacts database service
-        self.contacts_db_service = ContactsDBService()
+        # Without OpenRouter every message runs the local models, so group messages
+        # arriving together into one batched forward pass
+        self.nlu_batcher = None
+        if not self.intent_recognizer.openrouter_client.initialized:
+            self.nlu_batcher = NLUBatcher(self.intent_recognizer, self.entity_extractor)
+            
+            # Load (and compile) the models in the background so the first message doesn't wait
+            if WARMUP_MODELS:
+                threading.Thread(target=self._warm_up_models, name="model-warmup", daemon=True).start()
+        
+        # Email, calendar and contacts services are created on first use (see the properties below)
         
         # Try to sync contacts if Google service is available (It syns evertime you run the application)
         # if self.contacts_service.service:
         #     print("Syncing contacts to local database...")
         #     self.contacts_db_service.sync_contacts(self.contacts_service)
         
-        # User state for multi-step conversations
-        self.user_state = {}
+        # Contact lookups by normalized name, expired after 5 minutes and cleared when contacts are synced
+        self._contact_cache = TTLCache(maxsize=512, ttl=300)
+        
+        # The coming week's events, keyed by the day they were fetched for; cleared when a meeting is booked
+        self._calendar_cache = TTLCache(maxsize=1, ttl=_CALENDAR_CACHE_TTL)
+        
+        # Replies queued while a message is handled, per handling thread
+        self._outbox = threading.local()
+        
+        # User state for multi-step conversations, dropped after a period of inactivity
+        self.user_state = ConversationStore()
+        
+        # Handlers for new messages, by intent
+        self._intent_handlers = {
+            IntentRecognizer.INTENT_SEND_EMAIL: self._handle_send_email,
+            IntentRecognizer.INTENT_SCHEDULE_MEETING: self._handle_schedule_meeting,
+            IntentRecognizer.INTENT_CHECK_CALENDAR: self._handle_check_calendar,
+            IntentRecognizer.INTENT_FIND_CONTACT: self._handle_find_contact,
+            IntentRecognizer.INTENT_CHECK_FREE_SLOTS: self._handle_check_free_slots,
+        }
+        
+        # Handlers for ongoing conversations, by conversation type and step
+        self._conversation_steps = {
+            "email": {
+                "recipient": self._email_recipient_step,
+                "subject": self._email_subject_step,
+                "body": self._email_body_step,
+                "confirm": self._email_confirm_step,
+            },
+            "meeting": {
+                "person": self._meeting_person_step,
+                "confirm_email": self._meeting_confirm_email_step,
+                "date": self._meeting_date_step,
+                "time": self._meeting_time_step,
+                "confirm": self._meeting_confirm_step,
+            },
+        }
+    
+    @functools.cached_property
+    def email_service(self):
+        """Gmail service, authenticated on first use."""
+        return EmailService()
+    
+    @functools.cached_property
+    def calendar_service(self):
+        """Shared calendar service, authenticated on first use."""
+        return CalendarService.instance()
+    
+    @functools.cached_property
+    def contacts_service(self):
+        """Google Contacts service, authenticated on first use."""
+        return ContactsService()
+    
+    @functools.cached_property
+    def contacts_db_service(self):
+        """Local contacts database, opened on first use."""
+        return ContactsDBService()
+    
+    def _warm_up_models(self):
+        """Load the local NLU models and run each once."""
+        try:
+            self.intent_recognizer.warm_up()
+            self.entity_extractor.warm_up()
+            logger.info("Local NLU models warmed up")
+        except Exception as e:
+            logger.error("Error warming up NLU models: %s", e)
     
     def handle_message(self, from_number, message_text, timestamp=None):
         """
@@ -49,18 +192,28 @@ class MessageHandler:
             message_text: Message content
             timestamp: Message timestamp (optional)
         """
+        # Queue replies and send them together once the message is handled
+        self._outbox.messages = []
+        try:
+            self._handle_message(from_number, message_text)
+        finally:
+            messages = self._outbox.messages
+            self._outbox.messages = None
+            self._flush_responses(from_number, messages)
+    
+    def _handle_message(self, from_number, message_text):
+        """Process an incoming message, queueing any replies."""
         try:
-            print(f"Received message from {from_number}: {message_text}")
+            logger.info("Received message from %s: %s", from_number, message_text)
             
-            # For debugging, print current user state
-            if from_number in self.user_state:
-                print(f"Current user state: {self.user_state[from_number]}")
-            else:
-                print("No existing conversation state")
+            # Read the conversation state once for the whole turn
+            state = self.user_state.get(from_number)
+            logger.debug("Current user state: %s", state)
             
             # Check for sync command
-            if message_text.lower() == "sync contacts":
+            if message_text.casefold() == "sync contacts":
                 success = self.contacts_db_service.sync_contacts(self.contacts_service)
+                self._contact_cache.clear()
                 if isinstance(success, dict) and success.get("success"):
                     if success.get("complete"):
                         self._send_response(from_number, "✅ Contacts synchronized successfully!")
@@ -75,413 +228,418 @@ class MessageHandler:
                     )
                 return
                 
+            # Current time, shared by every step that handles this message
+            now = get_current_time()
+            
             # Always prioritize ongoing conversations
-            if from_number in self.user_state:
-                conversation_handled = self._continue_conversation(from_number, message_text)
+            if state is not None:
+                conversation_handled = self._continue_conversation(from_number, message_text, now, state)
                 if conversation_handled:
-                    print("Handled as part of ongoing conversation")
+                    logger.debug("Handled as part of ongoing conversation")
                     return  # Exit early if conversation was handled
+                
+                # A bare control word answers a prompt, so running NLU on it is wasted work
+                if message_text.strip().casefold() in _CONTROL_WORDS:
+                    self._send_help_response(from_number)
+                    return
             
             # Process new intent if not in a conversation
-            intent_data = self.intent_recognizer.recognize_intent(message_text)
+            if self.nlu_batcher:
+                intent_data, entities = self.nlu_batcher.process(message_text)
+            else:
+                intent_data = self.intent_recognizer.recognize_intent(message_text)
+                entities = None
             intent = intent_data["intent"]
             confidence = intent_data.get("confidence", 0)
             
-            print(f"Detected intent: {intent} with confidence: {confidence}")
+            logger.debug("Detected intent: %s with confidence: %s", intent, confidence)
             
             # Extract entities
-            entities = self.entity_extractor.extract_entities(message_text, intent)
-            print(f"Extracted entities: {entities}")
+            if entities is None:
+                entities = self.entity_extractor.extract_entities(message_text, intent)
+            logger.debug("Extracted entities: %s", entities)
             
             # Process based on intent
-            if intent == IntentRecognizer.INTENT_SEND_EMAIL:
-                self._handle_send_email(from_number, message_text, entities)
-                    
-            elif intent == IntentRecognizer.INTENT_SCHEDULE_MEETING:
-                self._handle_schedule_meeting(from_number, message_text, entities)
-                    
-            elif intent == IntentRecognizer.INTENT_CHECK_CALENDAR:
-                self._handle_check_calendar(from_number, message_text, entities)
-                    
-            elif intent == IntentRecognizer.INTENT_FIND_CONTACT:
-                self._handle_find_contact(from_number, message_text, entities)
-                    
-            elif intent == IntentRecognizer.INTENT_CHECK_FREE_SLOTS:
-                self._handle_check_free_slots(from_number, message_text, entities)
-                    
+            handler = self._intent_handlers.get(intent)
+            if handler:
+                handler(from_number, message_text, entities, now)
             else:
                 # Unknown intent
-                self._send_response(from_number, 
-                    "I'm not sure what you're asking for. I can help you with:\n"
-                    "- Sending emails\n"
-                    "- Scheduling meetings\n"
-                    "- Checking your calendar\n"
-                    "- Finding contacts\n"
-                    "- Checking your availability\n\n"
-                    "Please try phrasing your request differently."
-                )
+                self._send_help_response(from_number)
         
         except Exception as e:
             # Log the error and send an apologetic message
-            print(f"Error handling message: {e}")
-            traceback.print_exc()
+            logger.exception("Error handling message: %s", e)
             self._send_response(
                 from_number,
                 "I'm sorry, I encountered an error while processing your request. "
                 "Please try again or rephrase your request."
             )
     
-    def _continue_conversation(self, from_number, message_text):
+    def _send_help_response(self, from_number):
+        """Tell the user what the assistant can help with."""
+        self._send_response(from_number, 
+            "I'm not sure what you're asking for. I can help you with:\n"
+            "- Sending emails\n"
+            "- Scheduling meetings\n"
+            "- Checking your calendar\n"
+            "- Finding contacts\n"
+            "- Checking your availability\n\n"
+            "Please try phrasing your request differently."
+        )
+    
+    def _continue_conversation(self, from_number, message_text, now=None, state=None):
         """
         Continue an ongoing conversation.
         
         Args:
             from_number: Sender's phone number
             message_text: Message content
+            now: Current time in the configured timezone (optional)
+            state: The user's conversation state, if already read (optional)
             
         Returns:
             True if conversation was continued, False otherwise
         """
-        state = self.user_state[from_number]
-        conversation_type = state.get("type")
-        step = state.get("step")
-        
-        # Different conversation flows
-        if conversation_type == "email":
-            if step == "recipient":
-                # User provided recipient
-                if message_text.lower() == "cancel":
-                    self._send_response(from_number, "Email canceled.")
-                    del self.user_state[from_number]
-                    return True
-                
-                state["recipient"] = message_text
-                self._send_response(from_number, 
-                    "What's the subject of the email? (or type 'cancel' to abort)"
-                )
-                state["step"] = "subject"
-                return True
-                
-            elif step == "subject":
-                # User provided subject
-                if message_text.lower() == "cancel":
-                    self._send_response(from_number, "Email canceled.")
-                    del self.user_state[from_number]
+        if now is None:
+            now = get_current_time()
+        
+        if state is None:
+            state = self.user_state[from_number]
+        handler = self._conversation_steps.get(state.type, {}).get(state.step)
+        
+        # No ongoing conversation or unhandled state
+        if handler is None:
+            return False
+        
+        return handler(from_number, message_text, state, now)
+    
+    def _email_recipient_step(self, from_number, message_text, state, now):
+        """Handle the recipient the user provided for an email."""
+        # User provided recipient
+        if message_text.casefold() == "cancel":
+            self._send_response(from_number, "Email canceled.")
+            self.user_state.pop(from_number, None)
+            return True
+        
+        state.recipient = message_text
+        self._send_response(from_number, 
+            "What's the subject of the email? (or type 'cancel' to abort)"
+        )
+        state.step = "subject"
+        return True
+    
+    def _email_subject_step(self, from_number, message_text, state, now):
+        """Handle the subject the user provided for an email."""
+        # User provided subject
+        if message_text.casefold() == "cancel":
+            self._send_response(from_number, "Email canceled.")
+            self.user_state.pop(from_number, None)
+            return True
+        
+        state.subject = message_text
+        self._send_response(from_number, 
+            "What's the content of the email? (or type 'cancel' to abort)"
+        )
+        state.step = "body"
+        return True
+    
+    def _email_body_step(self, from_number, message_text, state, now):
+        """Handle the body the user provided and ask to confirm the email."""
+        # User provided body
+        if message_text.casefold() == "cancel":
+            self._send_response(from_number, "Email canceled.")
+            self.user_state.pop(from_number, None)
+            return True
+        
+        state.body = message_text
+        
+        # Ask for confirmation
+        self._send_response(from_number, 
+            f"I'll send an email with:\n"
+            f"To: {state.recipient}\n"
+            f"Subject: {state.subject}\n"
+            f"Body: {state.body}\n\n"
+            f"Send it? (yes/no)"
+        )
+        state.step = "confirm"
+        return True
+    
+    def _email_confirm_step(self, from_number, message_text, state, now):
+        """Send the email if the user confirmed it."""
+        # User confirmed
+        if message_text.casefold() in _AFFIRM:
+            # Try to find contact if recipient is not an email
+            recipient = state.recipient
+            if "@" not in recipient:
+                contact_email = self._resolve_contact_email(recipient)
+                if contact_email:
+                    recipient = contact_email
+                else:
+                    self._send_response(from_number, 
+                        f"I couldn't find an email for '{recipient}'. "
+                        f"Please provide a valid email address or contact name."
+                    )
+                    state.step = "recipient"
                     return True
-                
-                state["subject"] = message_text
+            
+            # Send the email
+            result = self.email_service.send_email(
+                to=recipient,
+                subject=state.subject,
+                body=state.body
+            )
+            
+            if result["success"]:
                 self._send_response(from_number, 
-                    "What's the content of the email? (or type 'cancel' to abort)"
+                    "Email sent successfully!"
                 )
-                state["step"] = "body"
-                return True
-                
-            elif step == "body":
-                # User provided body
-                if message_text.lower() == "cancel":
-                    self._send_response(from_number, "Email canceled.")
-                    del self.user_state[from_number]
-                    return True
-                
-                state["body"] = message_text
-                
-                # Ask for confirmation
+            else:
                 self._send_response(from_number, 
-                    f"I'll send an email with:\n"
-                    f"To: {state['recipient']}\n"
-                    f"Subject: {state['subject']}\n"
-                    f"Body: {state['body']}\n\n"
-                    f"Send it? (yes/no)"
+                    f"Failed to send email: {result.get('error', 'Unknown error')}"
                 )
-                state["step"] = "confirm"
-                return True
-                
-            elif step == "confirm":
-                # User confirmed
-                if message_text.lower() in ["yes", "y", "sure", "ok", "send"]:
-                    # Try to find contact if recipient is not an email
-                    recipient = state["recipient"]
-                    if "@" not in recipient:
-                        # Try Google Contacts first
-                        contact = None
-                        try:
-                            contact = self.contacts_service.get_contact_by_name(recipient)
-                        except Exception as e:
-                            print(f"Error finding contact via Google: {e}")
-                        
-                        # If not found in Google, try local DB
-                        if not contact or not contact.get("email"):
-                            try:
-                                contact = self.contacts_db_service.get_contact_by_name(recipient)
-                            except Exception as e:
-                                print(f"Error finding contact in local DB: {e}")
-                        
-                        if contact and contact.get("email"):
-                            recipient = contact["email"]
-                        else:
-                            self._send_response(from_number, 
-                                f"I couldn't find an email for '{recipient}'. "
-                                f"Please provide a valid email address or contact name."
-                            )
-                            state["step"] = "recipient"
-                            return True
-                    
-                    # Send the email
-                    result = self.email_service.send_email(
-                        to=recipient,
-                        subject=state["subject"],
-                        body=state["body"]
-                    )
-                    
-                    if result["success"]:
-                        self._send_response(from_number, 
-                            "Email sent successfully!"
-                        )
-                    else:
-                        self._send_response(from_number, 
-                            f"Failed to send email: {result.get('error', 'Unknown error')}"
-                        )
-                    
-                    # Clear state
-                    del self.user_state[from_number]
-                    
+            
+            # Clear state
+            self.user_state.pop(from_number, None)
+            
+        else:
+            self._send_response(from_number, "Email canceled.")
+            self.user_state.pop(from_number, None)
+        
+        return True
+    
+    def _meeting_person_step(self, from_number, message_text, state, now):
+        """Handle the person the user provided for a meeting."""
+        # User provided person
+        if message_text.casefold() == "cancel":
+            self._send_response(from_number, "Meeting scheduling canceled.")
+            self.user_state.pop(from_number, None)
+            return True
+        
+        # Check if it's an email
+        if '@' in message_text or '.' in message_text:
+            is_valid, error_msg, suggestion = is_valid_email(message_text)
+            
+            if not is_valid:
+                response = f"The email '{message_text}' appears to be invalid. {error_msg}"
+                if suggestion:
+                    response += f"\n\nDid you mean '{suggestion}'? Please confirm or provide a correct email."
+                    # Save the suggestion for later use
+                    state.suggested_email = suggestion
+                    state.step = "confirm_email"
                 else:
-                    self._send_response(from_number, "Email canceled.")
-                    del self.user_state[from_number]
+                    response += "\n\nPlease provide a valid email address."
                 
+                self._send_response(from_number, response)
                 return True
         
-        elif conversation_type == "meeting":
-            if step == "person":
-                # User provided person
-                if message_text.lower() == "cancel":
-                    self._send_response(from_number, "Meeting scheduling canceled.")
-                    del self.user_state[from_number]
-                    return True
-                
-                # Check if it's an email
-                if '@' in message_text or '.' in message_text:
-                    is_valid, error_msg, suggestion = is_valid_email(message_text)
-                    
-                    if not is_valid:
-                        response = f"The email '{message_text}' appears to be invalid. {error_msg}"
-                        if suggestion:
-                            response += f"\n\nDid you mean '{suggestion}'? Please confirm or provide a correct email."
-                            # Save the suggestion for later use
-                            state["suggested_email"] = suggestion
-                            state["step"] = "confirm_email"
-                        else:
-                            response += "\n\nPlease provide a valid email address."
-                        
-                        self._send_response(from_number, response)
-                        return True
-                
-                state["person"] = message_text
-                
-                # If we already have a date, ask for time
-                if "date" in state:
-                    self._send_response(from_number, 
-                        f"What time on {format_date(state['date'])}? (or type 'cancel' to abort)"
-                    )
-                    state["step"] = "time"
+        state.person = message_text
+        
+        # If we already have a date, ask for time
+        if state.date is not None:
+            self._send_response(from_number, 
+                f"What time on {format_date(state.date)}? (or type 'cancel' to abort)"
+            )
+            state.step = "time"
+        else:
+            self._send_response(from_number, 
+                "What date? (or type 'cancel' to abort)"
+            )
+            state.step = "date"
+        
+        return True
+    
+    def _meeting_confirm_email_step(self, from_number, message_text, state, now):
+        """Handle the user's answer to a suggested email correction."""
+        msg = message_text.casefold()
+        
+        # Allow cancellation
+        if msg == "cancel":
+            self._send_response(from_number, "Meeting scheduling canceled.")
+            self.user_state.pop(from_number, None)
+            return True
+        
+        # User confirmed the suggested email
+        elif msg in _CONFIRM_EMAIL:
+            state.person = state.suggested_email
+            state.suggested_email = None
+            
+            # Continue with date
+            self._send_response(from_number, 
+                "What date? (or type 'cancel' to abort)"
+            )
+            state.step = "date"
+            return True
+            
+        # User provided a different email
+        elif '@' in message_text:
+            is_valid, error_msg, suggestion = is_valid_email(message_text)
+            
+            if not is_valid:
+                response = f"The email '{message_text}' still appears to be invalid. {error_msg}"
+                if suggestion:
+                    response += f"\n\nDid you mean '{suggestion}'?"
+                    state.suggested_email = suggestion
                 else:
-                    self._send_response(from_number, 
-                        "What date? (or type 'cancel' to abort)"
-                    )
-                    state["step"] = "date"
+                    response += "\n\nPlease provide a valid email address."
                 
+                self._send_response(from_number, response)
                 return True
                 
-            elif step == "confirm_email":
-                
-                # Allow cancellation
-                if message_text.lower() == "cancel":
-                    self._send_response(from_number, "Meeting scheduling canceled.")
-                    del self.user_state[from_number]
-                    return True
-                
-                # User confirmed the suggested email
-                elif message_text.lower() in ["yes", "y", "correct", "confirm", "right"]:
-                    state["person"] = state["suggested_email"]
-                    del state["suggested_email"]
-                    
-                    # Continue with date
-                    self._send_response(from_number, 
-                        "What date? (or type 'cancel' to abort)"
-                    )
-                    state["step"] = "date"
-                    return True
-                    
-                # User provided a different email
-                elif '@' in message_text:
-                    is_valid, error_msg, suggestion = is_valid_email(message_text)
-                    
-                    if not is_valid:
-                        response = f"The email '{message_text}' still appears to be invalid. {error_msg}"
-                        if suggestion:
-                            response += f"\n\nDid you mean '{suggestion}'?"
-                            state["suggested_email"] = suggestion
-                        else:
-                            response += "\n\nPlease provide a valid email address."
-                        
-                        self._send_response(from_number, response)
-                        return True
-                        
-                    # Email is valid
-                    state["person"] = message_text
-                    del state["suggested_email"]
-                    
-                    # Continue with date
-                    self._send_response(from_number, 
-                        "What date? (or type 'cancel' to abort)"
-                    )
-                    state["step"] = "date"
-                    return True
-                    
-                else:
-                    # User rejected suggestion but didn't provide a new email
-                    self._send_response(from_number, 
-                        "Please provide a valid email address or type 'cancel' to abort."
-                    )
-                    return True
-                    
-            elif step == "date":
-                # User provided date
-                if message_text.lower() == "cancel":
-                    self._send_response(from_number, "Meeting scheduling canceled.")
-                    del self.user_state[from_number]
-                    return True
-                
-                # Extract date
-                entities = self.entity_extractor.extract_entities(message_text)
-                date = entities.get("date")
-                
-                if not date:
-                    self._send_response(from_number, 
-                        "I couldn't understand that date. Please provide a specific date "
-                        "like 'tomorrow', 'next Friday', or 'May 15th'."
-                    )
-                    return True
-                
-                # Check if date is in the past
-                current_date = get_current_time().date()
-                if date < current_date:
-                    self._send_response(from_number, 
-                        f"The date {format_date(date)} has already passed. "
-                        f"Please provide a future date."
-                    )
-                    return True
-                
-                state["date"] = date
-                
-                # If we already have a time, check availability
-                if "time" in state:
-                    return self._check_meeting_availability(from_number, state)
-                else:
-                    self._send_response(from_number, 
-                        f"What time on {format_date(date)}? (or type 'cancel' to abort)"
-                    )
-                    state["step"] = "time"
-                
+            # Email is valid
+            state.person = message_text
+            state.suggested_email = None
+            
+            # Continue with date
+            self._send_response(from_number, 
+                "What date? (or type 'cancel' to abort)"
+            )
+            state.step = "date"
+            return True
+            
+        else:
+            # User rejected suggestion but didn't provide a new email
+            self._send_response(from_number, 
+                "Please provide a valid email address or type 'cancel' to abort."
+            )
+            return True
+    
+    def _meeting_date_step(self, from_number, message_text, state, now):
+        """Handle the date the user provided for a meeting."""
+        # User provided date
+        if message_text.casefold() == "cancel":
+            self._send_response(from_number, "Meeting scheduling canceled.")
+            self.user_state.pop(from_number, None)
+            return True
+        
+        # Extract date
+        date = self.entity_extractor.extract_date_only(message_text)
+        
+        if not date:
+            self._send_response(from_number, 
+                "I couldn't understand that date. Please provide a specific date "
+                "like 'tomorrow', 'next Friday', or 'May 15th'."
+            )
+            return True
+        
+        # Check if date is in the past
+        current_date = now.date()
+        if date < current_date:
+            self._send_response(from_number, 
+                f"The date {format_date(date)} has already passed. "
+                f"Please provide a future date."
+            )
+            return True
+        
+        state.date = date
+        
+        # If we already have a time, check availability
+        if state.time is not None:
+            return self._check_meeting_availability(from_number, state, now)
+        else:
+            self._send_response(from_number, 
+                f"What time on {format_date(date)}? (or type 'cancel' to abort)"
+            )
+            state.step = "time"
+        
+        return True
+    
+    def _meeting_time_step(self, from_number, message_text, state, now):
+        """Handle the time the user provided for a meeting."""
+        # User provided time
+        if message_text.casefold() == "cancel":
+            self._send_response(from_number, "Meeting scheduling canceled.")
+            self.user_state.pop(from_number, None)
+            return True
+        
+        # Extract time
+        time = self.entity_extractor.extract_time_only(message_text)
+        
+        if not time:
+            self._send_response(from_number, 
+                "I couldn't understand that time. Please provide a specific time "
+                "like '3pm', '15:30', or 'at 2 o'clock'."
+            )
+            return True
+        
+        # Ensure time is a datetime.time object
+        if isinstance(time, str):
+            try:
+                # Parse the HH:MM string directly rather than through strptime
+                hour, minute = time.split(":")
+                time = datetime.time(int(hour), int(minute))
+            except ValueError:
+                self._send_response(from_number, 
+                    "I couldn't process that time format. Please use HH:MM format (e.g. 13:00)."
+                )
                 return True
+        
+        state.time = time
+        logger.debug("Set time in state: %s", time)
+        
+        # Check availability
+        return self._check_meeting_availability(from_number, state, now)
+    
+    def _meeting_confirm_step(self, from_number, message_text, state, now):
+        """Book the meeting if the user confirmed it or picked an alternative slot."""
+        msg = message_text.casefold()
+        
+        # User confirmed or selected a slot
+        if msg in _AFFIRM_BOOKING:
+            # Book the meeting
+            return self._book_meeting(from_number, state)
+        elif msg in _DENY:
+            self._send_response(from_number, "Meeting scheduling canceled.")
+            self.user_state.pop(from_number, None)
+            return True
+        elif message_text.isdigit():
+            # User selected an alternative slot
+            slot_index = int(message_text) - 1
+            if 0 <= slot_index < len(state.alternative_slots):
+                slot = state.alternative_slots[slot_index]
                 
-            elif step == "time":
-                # User provided time
-                if message_text.lower() == "cancel":
-                    self._send_response(from_number, "Meeting scheduling canceled.")
-                    del self.user_state[from_number]
-                    return True
-                
-                # Extract time
-                entities = self.entity_extractor.extract_entities(message_text)
-                time = entities.get("time")
-                
-                if not time:
-                    self._send_response(from_number, 
-                        "I couldn't understand that time. Please provide a specific time "
-                        "like '3pm', '15:30', or 'at 2 o'clock'."
-                    )
-                    return True
-                
-                # Ensure time is a datetime.time object
-                if isinstance(time, str):
-                    try:
-                        # Try to parse the time string
-                        time_obj = datetime.datetime.strptime(time, "%H:%M").time()
-                        time = time_obj
-                    except ValueError:
-                        self._send_response(from_number, 
-                            "I couldn't process that time format. Please use HH:MM format (e.g. 13:00)."
-                        )
-                        return True
-                
-                state["time"] = time
-                print(f"Set time in state: {time} (type: {type(time)})")
-                
-                # Check availability
-                return self._check_meeting_availability(from_number, state)
+                # Update state with selected slot
+                state.date = slot[0].date()
+                state.time = slot[0].time()
+                state.end_time = slot[1].time()
                 
-            elif step == "confirm":
-                # User confirmed or selected a slot
-                if message_text.lower() in ["yes", "y", "sure", "ok", "book", "1"]:
-                    # Book the meeting
-                    return self._book_meeting(from_number, state)
-                elif message_text.lower() in ["no", "n", "nope", "cancel"]:
-                    self._send_response(from_number, "Meeting scheduling canceled.")
-                    del self.user_state[from_number]
-                    return True
-                elif message_text.isdigit():
-                    # User selected an alternative slot
-                    slot_index = int(message_text) - 1
-                    if 0 <= slot_index < len(state.get("alternative_slots", [])):
-                        slot = state["alternative_slots"][slot_index]
-                        
-                        # Update state with selected slot
-                        state["date"] = slot[0].date()
-                        state["time"] = slot[0].time()
-                        state["end_time"] = slot[1].time()
-                        
-                        # Book the meeting
-                        return self._book_meeting(from_number, state)
-                    else:
-                        self._send_response(from_number, 
-                            "Invalid selection. Please choose a number from the list "
-                            "or type 'cancel' to abort."
-                        )
-                        return True
-                else:
-                    self._send_response(from_number, 
-                        "I didn't understand your response. Please answer with 'yes', 'no', "
-                        "or the number of an alternative slot."
-                    )
-                    return True
-        
-        # No ongoing conversation or unhandled state
-        return False
+                # Book the meeting
+                return self._book_meeting(from_number, state)
+            else:
+                self._send_response(from_number, 
+                    "Invalid selection. Please choose a number from the list "
+                    "or type 'cancel' to abort."
+                )
+                return True
+        else:
+            self._send_response(from_number, 
+                "I didn't understand your response. Please answer with 'yes', 'no', "
+                "or the number of an alternative slot."
+            )
+            return True
     
-    def _check_meeting_availability(self, from_number, state):
+    def _check_meeting_availability(self, from_number, state, now=None):
         """
         Check availability for a meeting and ask for confirmation.
         
         Args:
             from_number: Sender's phone number
             state: Current conversation state
+            now: Current time in the configured timezone (optional)
             
         Returns:
             True to indicate the conversation was handled
         """
-        date = state["date"]
-        time = state["time"]
+        date = state.date
+        time = state.time
         
         # Create datetime objects
         try:
             # Get current time in the configured timezone
-            current_dt = get_current_time()
+            current_dt = now or get_current_time()
             
             # Create a timezone-aware datetime for the requested meeting time
-            start_dt = datetime.datetime.combine(date, time)
-            # Make it timezone-aware
-            start_dt = pytz.timezone(TIME_ZONE).localize(start_dt)
+            start_dt = datetime.datetime.combine(date, time, tzinfo=_TIMEZONE)
             
             # Check if datetime is in the past
             if start_dt < current_dt:
@@ -491,115 +649,79 @@ class MessageHandler:
                     f"Current time is {current_dt.strftime('%H:%M')}. "
                     f"Please provide a future time."
                 )
-                state["step"] = "time"
+                state.step = "time"
                 return True
             
             # Set default duration if not specified
-            duration = state.get("duration", 30)  # Default 30 minutes
+            duration = state.duration or 30  # Default 30 minutes
             end_dt = start_dt + datetime.timedelta(minutes=duration)
             
             # Assign end time to state
-            state["end_time"] = end_dt.time()
+            state.end_time = end_dt.time()
             
-            # Check calendar for conflicts - simplified approach
-            try:
-                # Convert to ISO format for the API
-                time_min = start_dt.isoformat()
-                time_max = end_dt.isoformat()
-                
-                events_result = self.calendar_service.service.events().list(
-                    calendarId='primary',
-                    timeMin=time_min,
-                    timeMax=time_max,
-                    maxResults=10,
-                    singleEvents=True,
-                    orderBy='startTime'
-                ).execute()
-                
-                events = events_result.get('items', [])
-                
-            except Exception as e:
-                print(f"Calendar API error checking conflicts: {e}")
-                events = []  # Assume no conflicts on error
+            # Look up the attendee while the calendar is being checked
+            person = state.person or "the person"
+            contact_future = None
+            if "@" not in person:
+                contact_future = _io_executor.submit(self._resolve_contact, person)
+            
+            # Check calendar for conflicts and fetch the day's free slots (8 AM - 6 PM)
+            # in one request
+            day_start = start_dt.replace(hour=8, minute=0, second=0, microsecond=0)
+            day_end = start_dt.replace(hour=18, minute=0, second=0, microsecond=0)
+            has_conflict, free_slots = self.calendar_service.check_availability(
+                start_dt, end_dt, day_start, day_end, duration_minutes=duration
+            )
+            
+            # Keep the resolved attendee so booking doesn't look it up again
+            contact = contact_future.result() if contact_future else None
+            if contact:
+                state.resolved_name = contact["name"]
+                state.resolved_email = contact["email"]
             
-            if events:
+            if has_conflict:
                 # There's a conflict
-                try:
-                    free_slots = self.calendar_service.get_free_slots(
-                        date=date,
-                        start_time=datetime.time(8, 0),  # 8 AM
-                        end_time=datetime.time(18, 0),   # 6 PM
-                        duration_minutes=duration
-                    )
-                except Exception as e:
-                    print(f"Error getting free slots: {e}")
-                    free_slots = []
-                
                 if not free_slots:
                     self._send_response(from_number, 
                         f"I'm sorry, you don't have any free {duration}-minute slots "
                         f"on {format_date(date)}. Would you like to try another date?"
                     )
-                    state["step"] = "date"
+                    state.step = "date"
                     return True
                 
-                # Find and suggest alternative slots
-                formatted_slots = []
-                state["alternative_slots"] = []
-                
-                # Limit to 5 suggestions
-                for i, (slot_start, slot_end) in enumerate(free_slots[:5]):
-                    formatted_slots.append(f"{i+1}. {format_time(slot_start)} - {format_time(slot_end)}")
-                    state["alternative_slots"].append((slot_start, slot_end))
+                # Find and suggest alternative slots (limit to 5 suggestions)
+                state.alternative_slots = free_slots[:5]
                 
                 self._send_response(from_number, 
                     f"You already have a meeting at {format_time(time)} on {format_date(date)}. "
                     f"Here are some free {duration}-minute slots:\n\n" +
-                    "\n".join(formatted_slots) +
+                    "\n".join(
+                        f"{i}. {format_time(slot_start)} - {format_time(slot_end)}"
+                        for i, (slot_start, slot_end) in enumerate(state.alternative_slots, 1)
+                    ) +
                     "\n\nPlease choose a slot by number, or type 'cancel' to abort."
                 )
-                state["step"] = "confirm"
+                state.step = "confirm"
                 
             else:
                 # Slot is available, ask for confirmation
-                person = state.get("person", "the person")
-                
-                # Try to find contact if it's a name
-                contact_info = ""
-                if "@" not in person:
-                    # Try Google Contacts first
-                    contact = None
-                    try:
-                        contact = self.contacts_service.get_contact_by_name(person)
-                    except Exception as e:
-                        print(f"Error finding contact via Google: {e}")
-                    
-                    # If not found in Google, try local DB
-                    if not contact or not contact.get("email"):
-                        try:
-                            contact = self.contacts_db_service.get_contact_by_name(person)
-                        except Exception as e:
-                            print(f"Error finding contact in local DB: {e}")
-                    
-                    if contact and contact.get("email"):
-                        contact_info = f" ({contact['email']})"
+                contact_info = f" ({contact['email']})" if contact else ""
                 
                 self._send_response(from_number, 
                     f"I'll schedule a {duration}-minute meeting with {person}{contact_info} "
                     f"on {format_date(date)} at {format_time(time)}. "
                     f"Is that correct? (yes/no)"
                 )
-                state["step"] = "confirm"
+                state.step = "confirm"
             
             return True
             
         except Exception as e:
-            print(f"Error checking meeting availability: {e}")
-            traceback.print_exc()  # Add stack trace for debugging
+            logger.exception("Error checking meeting availability: %s", e)
             self._send_response(from_number, 
                 "I couldn't process the meeting time. Please try again with a different format."
             )
-            del self.user_state[from_number]
+            self.user_state.pop(from_number, None)
             return True
     
     def _book_meeting(self, from_number, state):
@@ -614,33 +736,23 @@ class MessageHandler:
             True to indicate the conversation was handled
         """
         try:
-            person = state["person"]
-            date = state["date"]
-            time = state["time"]
-            end_time = state["end_time"]
+            person = state.person
+            date = state.date
+            time = state.time
+            end_time = state.end_time
             
             # Create datetime objects
             start_dt = datetime.datetime.combine(date, time)
             end_dt = datetime.datetime.combine(date, end_time)
             
-            # Try to find contact if it's a name
+            # Use the contact resolved during the availability check, or find it if it's a name
             attendees = []
-            if "@" not in person:
-                # Try Google Contacts first
-                contact = None
-                try:
-                    contact = self.contacts_service.get_contact_by_name(person)
-                except Exception as e:
-                    print(f"Error finding contact via Google: {e}")
-                
-                # If not found in Google, try local DB
-                if not contact or not contact.get("email"):
-                    try:
-                        contact = self.contacts_db_service.get_contact_by_name(person)
-                    except Exception as e:
-                        print(f"Error finding contact in local DB: {e}")
-                
-                if contact and contact.get("email"):
+            if state.resolved_email:
+                person = state.resolved_name
+                attendees.append(state.resolved_email)
+            elif "@" not in person:
+                contact = self._resolve_contact(person)
+                if contact:
                     person = contact["name"]
                     attendees.append(contact["email"])
             else:
@@ -659,7 +771,7 @@ class MessageHandler:
                         self._send_response(from_number,
                             f"Did you mean '{suggestion}'? Please try again with the correct email."
                         )
-                    del self.user_state[from_number]
+                    self.user_state.pop(from_number, None)
                     return True
                 valid_attendees.append(attendee_email)
                 
@@ -668,13 +780,14 @@ class MessageHandler:
                 summary=f"Meeting with {person}",
                 start_time=start_dt,
                 end_time=end_dt,
-                description=state.get("description", ""),
-                location=state.get("location", ""),
+                description=state.description or "",
+                location=state.location or "",
                 attendees=attendees,
                 send_notifications=True
             )
             
             if result["success"]:
+                self._calendar_cache.clear()
                 self._send_response(from_number, 
                     f"✅ Meeting scheduled successfully!\n\n"
                     f"Meeting with {person}\n"
@@ -688,18 +801,18 @@ class MessageHandler:
                 )
             
             # Clear state
-            del self.user_state[from_number]
+            self.user_state.pop(from_number, None)
             return True
             
         except Exception as e:
-            print(f"Error booking meeting: {e}")
+            logger.exception("Error booking meeting: %s", e)
             self._send_response(from_number, 
                 "I encountered an error while scheduling the meeting. Please try again."
             )
-            del self.user_state[from_number]
+            self.user_state.pop(from_number, None)
             return True
     
-    def _handle_send_email(self, from_number, message_text, entities):
+    def _handle_send_email(self, from_number, message_text, entities, now):
         """
         Handle email sending intent.
         
@@ -707,6 +820,7 @@ class MessageHandler:
             from_number: Sender's phone number
             message_text: Message content
             entities: Extracted entities
+            now: Current time in the configured timezone
         """
         # Check if we have all required entities
         person = entities.get("person", [])
@@ -719,22 +833,7 @@ class MessageHandler:
             recipient = email[0] if email else None
             
             if not recipient and person:
-                # Try Google Contacts first
-                contact = None
-                try:
-                    contact = self.contacts_service.get_contact_by_name(person[0])
-                except Exception as e:
-                    print(f"Error finding contact via Google: {e}")
-                
-                # If not found in Google, try local DB
-                if not contact or not contact.get("email"):
-                    try:
-                        contact = self.contacts_db_service.get_contact_by_name(person[0])
-                    except Exception as e:
-                        print(f"Error finding contact in local DB: {e}")
-                
-                if contact and contact.get("email"):
-                    recipient = contact["email"]
+                recipient = self._resolve_contact_email(person[0])
             
             if recipient:
                 result = self.email_service.send_email(
@@ -759,39 +858,16 @@ class MessageHandler:
         if email:
             recipient = email[0]
         elif person:
-            # Try Google Contacts first
-            contact = None
-            try:
-                contact = self.contacts_service.get_contact_by_name(person[0])
-            except Exception as e:
-                print(f"Error finding contact via Google: {e}")
-            
-            # If not found in Google, try local DB
-            if not contact or not contact.get("email"):
-                try:
-                    contact = self.contacts_db_service.get_contact_by_name(person[0])
-                except Exception as e:
-                    print(f"Error finding contact in local DB: {e}")
-            
-            if contact and contact.get("email"):
-                recipient = contact["email"]
-            else:
-                recipient = person[0]
+            recipient = self._resolve_contact_email(person[0]) or person[0]
         
         # Initialize state
-        state = {
-            "type": "email",
-            "step": "recipient" if not recipient else "subject",
-        }
-        
-        if recipient:
-            state["recipient"] = recipient
-        if subject:
-            state["subject"] = subject
-        if body:
-            state["body"] = body
-        
-        self.user_state[from_number] = state
+        self.user_state[from_number] = ConversationState(
+            type="email",
+            step="recipient" if not recipient else "subject",
+            recipient=recipient or None,
+            subject=subject or None,
+            body=body or None,
+        )
         
         # Ask for missing information
         if not recipient:
@@ -807,7 +883,7 @@ class MessageHandler:
                 f"What's the content of the email to {recipient}?"
             )
     
-    def _handle_schedule_meeting(self, from_number, message_text, entities):
+    def _handle_schedule_meeting(self, from_number, message_text, entities, now):
         """
         Handle meeting scheduling intent.
         
@@ -815,6 +891,7 @@ class MessageHandler:
             from_number: Sender's phone number
             message_text: Message content
             entities: Extracted entities
+            now: Current time in the configured timezone
         """
         # Extract entities
         person = entities.get("person", [])
@@ -825,29 +902,21 @@ class MessageHandler:
         subject = entities.get("subject")
         
         # Initialize state
-        state = {
-            "type": "meeting",
-            "step": "person",
-        }
-        
-        if person:
-            state["person"] = person[0]
-            state["step"] = "date" if not date else "time"
-        
-        if date:
-            state["date"] = date
-        
-        if time:
-            state["time"] = time
-        
-        if duration:
-            state["duration"] = duration
-        
-        if location:
-            state["location"] = location
+        if not person:
+            step = "person"
+        else:
+            step = "date" if not date else "time"
         
-        if subject:
-            state["description"] = subject
+        state = ConversationState(
+            type="meeting",
+            step=step,
+            person=person[0] if person else None,
+            date=date or None,
+            time=time or None,
+            duration=duration or None,
+            location=location or None,
+            description=subject or None,
+        )
         
         # Save state
         self.user_state[from_number] = state
@@ -867,9 +936,9 @@ class MessageHandler:
             )
         else:
             # We have enough information to check availability
-            self._check_meeting_availability(from_number, state)
+            self._check_meeting_availability(from_number, state, now)
     
-    def _handle_check_calendar(self, from_number, message_text, entities):
+    def _handle_check_calendar(self, from_number, message_text, entities, now):
         """
         Handle calendar checking intent.
         
@@ -877,91 +946,60 @@ class MessageHandler:
             from_number: Sender's phone number
             message_text: Message content
             entities: Extracted entities
+            now: Current time in the configured timezone
         """
         # Extract date
         date = entities.get("date")
+        today = now.date()
         
         # Check for "today" in the message
-        today_keywords = ["today", "today's", "todays"]
-        is_today_query = any(keyword in message_text.lower() for keyword in today_keywords)
+        is_today_query = _TODAY_REGEX.search(message_text) is not None
         
         if is_today_query:
             # Force date to today
-            date = get_current_time().date()
-            print(f"Found 'today' reference, setting date to today: {date}")
+            date = today
+            logger.debug("Found 'today' reference, setting date to today: %s", date)
         
         if not date:
-            # Check if the message is about today
-            if is_today_query:
-                date = get_current_time().date()
-                print(f"Inferred today's date from message: {date}")
+            # No date specified, show next event
+            next_event = self.calendar_service.get_next_event()
+            
+            if next_event:
+                self._send_response(from_number, 
+                    f"Your next event is:\n\n"
+                    f"📅 {next_event['summary']}\n"
+                    f"📆 {next_event['weekday']}, {next_event['date']}\n"
+                    f"🕒 {next_event['time']}\n"
+                    + (f"📍 {next_event['location']}\n" if next_event.get('location') else "")
+                    + (f"📝 {next_event['description']}" if next_event.get('description') else "")
+                )
             else:
-                # No date specified, show next event
-                next_event = self.calendar_service.get_next_event()
-                
-                if next_event:
-                    self._send_response(from_number, 
-                        f"Your next event is:\n\n"
-                        f"📅 {next_event['summary']}\n"
-                        f"📆 {next_event['weekday']}, {next_event['date']}\n"
-                        f"🕒 {next_event['time']}\n"
-                        + (f"📍 {next_event['location']}\n" if next_event.get('location') else "")
-                        + (f"📝 {next_event['description']}" if next_event.get('description') else "")
-                    )
-                else:
-                    self._send_response(from_number, 
-                        "You don't have any upcoming events on your calendar."
-                    )
-                
-                return
+                self._send_response(from_number, 
+                    "You don't have any upcoming events on your calendar."
+                )
+            
+            return
         
         # Get events for the specified date
-        events = self.calendar_service.get_events(
-            start_date=date,
-            end_date=date
-        )
+        events = self._get_events_for_date(date, today)
+        date_str = "today" if date == today else format_date(date)
         
         if events:
-            # Format events
-            formatted_events = []
-            for event in events:
-                start_time = event['start']
-                
-                # Convert to datetime if string
-                if isinstance(start_time, str):
-                    if 'T' in start_time:
-                        start_time = datetime.datetime.fromisoformat(start_time.replace('Z', '+00:00'))
-                    else:
-                        start_time = datetime.datetime.strptime(start_time, "%Y-%m-%d")
-                
-                # Format time
-                time_str = format_time(start_time)
-                
-                # Add to list
-                formatted_events.append(f"🕒 {time_str} - {event['summary']}")
-            
-            # Get the date string
-            if date == get_current_time().date():
-                date_str = "today"
-            else:
-                date_str = format_date(date)
+            # Format events (start times come from the API as RFC 3339 or all-day date strings)
+            formatted_events = "\n".join(
+                _format_event_line(format_time(_event_bound(event['start'])), event['summary'])
+                for event in events
+            )
             
             self._send_response(from_number, 
-                f"📅 Events for {date_str}:\n\n" +
-                "\n".join(formatted_events)
+                _format_events_header(date_str) + formatted_events
             )
         else:
-            # Get the date string
-            if date == get_current_time().date():
-                date_str = "today"
-            else:
-                date_str = format_date(date)
-                
             self._send_response(from_number, 
                 f"You don't have any events scheduled for {date_str}."
             )
     
-    def _handle_find_contact(self, from_number, message_text, entities):
+    def _handle_find_contact(self, from_number, message_text, entities, now):
         """
         Handle contact finding intent with stricter matching.
         
@@ -969,18 +1007,16 @@ class MessageHandler:
             from_number: Sender's phone number
             message_text: Message content
             entities: Extracted entities
+            now: Current time in the configured timezone
         """
         # Extract person name
         person = entities.get("person", [])
         
         if not person:
             # Extract from message using more general approach
-            words = message_text.split()
-            for i, word in enumerate(words):
-                if word.lower() in ["for", "about", "contact", "email", "address", "phone"]:
-                    if i + 1 < len(words):
-                        person = [" ".join(words[i+1:])]
-                        break
+            match = _CONTACT_NAME_REGEX.search(message_text)
+            if match:
+                person = [" ".join(match.group(1).split())]
         
         if not person:
             self._send_response(from_number, 
@@ -991,45 +1027,46 @@ class MessageHandler:
         # Search for contact
         contacts = []
         try:
-            contacts = self.contacts_service.search_contacts(person[0])
+            contacts = self.contacts_service.search_contacts(person[0], include_details=True)
         except Exception as e:
-            print(f"Error searching contacts: {e}")
+            logger.error("Error searching contacts: %s", e)
         
         if contacts:
             if len(contacts) == 1:
-                # Get full details
-                contact_details = None
-                try:
-                    contact_details = self.contacts_service.get_contact_details(contacts[0]["resource_name"])
-                except Exception as e:
-                    print(f"Error getting contact details: {e}")
-                    contact_details = contacts[0]  # Use basic info if detailed fetch fails
+                # Get full details, which the search already fetched
+                contact_details = contacts[0].get("details")
+                if not contact_details:
+                    try:
+                        contact_details = self.contacts_service.get_contact_details(contacts[0]["resource_name"])
+                    except Exception as e:
+                        logger.error("Error getting contact details: %s", e)
+                        contact_details = contacts[0]  # Use basic info if detailed fetch fails
                 
                 if contact_details:
                     # Format details
-                    details_text = f"📇 Contact information for {contact_details['name']}:\n\n"
+                    parts = [f"📇 Contact information for {contact_details['name']}:\n\n"]
                     
                     # Add email(s)
                     if contact_details.get('all_emails'):
-                        details_text += "📧 Email addresses:\n"
-                        for i, email in enumerate(contact_details['all_emails']):
-                            details_text += f"   {i+1}. {email}\n"
+                        parts.append("📧 Email addresses:\n")
+                        parts.extend(f"   {i}. {email}\n" for i, email in enumerate(contact_details['all_emails'], 1))
                     elif contact_details.get('email'):
-                        details_text += f"📧 Email: {contact_details['email']}\n"
+                        parts.append(f"📧 Email: {contact_details['email']}\n")
                     
                     # Add phone(s)
                     if contact_details.get('all_phones'):
-                        details_text += "📱 Phone numbers:\n"
-                        for i, phone in enumerate(contact_details['all_phones']):
-                            details_text += f"   {i+1}. {phone}\n"
+                        parts.append("📱 Phone numbers:\n")
+                        parts.extend(f"   {i}. {phone}\n" for i, phone in enumerate(contact_details['all_phones'], 1))
                     elif contact_details.get('phone'):
-                        details_text += f"📱 Phone: {contact_details['phone']}\n"
+                        parts.append(f"📱 Phone: {contact_details['phone']}\n")
                     
                     # Add other details
-                    details_text += f"🏢 Organization: {contact_details['organization']}\n" if contact_details.get('organization') else ""
-                    details_text += f"📍 Address: {contact_details['address']}" if contact_details.get('address') else ""
+                    if contact_details.get('organization'):
+                        parts.append(f"🏢 Organization: {contact_details['organization']}\n")
+                    if contact_details.get('address'):
+                        parts.append(f"📍 Address: {contact_details['address']}")
                     
-                    self._send_response(from_number, details_text)
+                    self._send_response(from_number, "".join(parts))
                 else:
                     # Format basic info safely
                     contact_info = f"Found contact: {contacts[0]['name']}"
@@ -1041,32 +1078,169 @@ class MessageHandler:
                     self._send_response(from_number, contact_info)
             else:
                 # Multiple contacts found
-                contacts_text = f"Found {len(contacts)} contacts for '{person[0]}':\n\n"
+                parts = [f"Found {len(contacts)} contacts for '{person[0]}':\n\n"]
                 
-                for i, contact in enumerate(contacts):
-                    contacts_text += f"{i+1}. {contact['name']}"
+                for i, contact in enumerate(contacts, 1):
+                    parts.append(f"{i}. {contact['name']}")
                     if contact.get('email'):
-                        contacts_text += f" ({contact['email']})"
+                        parts.append(f" ({contact['email']})")
                     if contact.get('phone'):
-                        contacts_text += f" - {contact['phone']}"
-                    contacts_text += "\n"
+                        parts.append(f" - {contact['phone']}")
+                    parts.append("\n")
                 
-                self._send_response(from_number, contacts_text)
+                self._send_response(from_number, "".join(parts))
         else:
             self._send_response(from_number, 
                 f"No contacts found for '{person[0]}'."
             )
                         
+    def _get_events_for_date(self, date, today):
+        """
+        Get the events on a date, serving the coming week from one cached request.
+        
+        Args:
+            date: The date to get events for
+            today: Today's date in the configured timezone
+            
+        Returns:
+            List of event dicts with 'start' and 'summary' keys
+        """
+        if not today <= date < today + datetime.timedelta(days=_CALENDAR_PREFETCH_DAYS):
+            return self.calendar_service.get_events(
+                start_date=date,
+                end_date=date,
+                fields=('start', 'summary')
+            )
+        
+        week_events = self._calendar_cache.get(today)
+        if week_events is None:
+            week_events = self.calendar_service.get_events(
+                start_date=today,
+                end_date=today + datetime.timedelta(days=_CALENDAR_PREFETCH_DAYS - 1),
+                max_results=250,
+                fields=('start', 'end', 'summary')
+            )
+            
+            # An empty list may mean the request failed, so only cache actual events
+            if week_events:
+                self._calendar_cache[today] = week_events
+        
+        # Keep the events overlapping the day, as a query for that day would return
+        day_start = datetime.datetime.combine(date, datetime.time(), tzinfo=_TIMEZONE)
+        day_end = day_start + datetime.timedelta(days=1)
+        events = [
+            event for event in week_events
+            if _event_bound(event['start']) < day_end and _event_bound(event['end']) > day_start
+        ]
+        return events[:_MAX_EVENTS_PER_DAY]
+    
+    def _resolve_contact_email(self, name):
+        """
+        Find the email address of a contact by name.
+        
+        Args:
+            name: Contact name to search for
+            
+        Returns:
+            The contact's email address, or None if not found
+        """
+        contact = self._resolve_contact(name)
+        return contact["email"] if contact else None
+    
+    def _resolve_contact(self, name):
+        """
+        Find a contact with an email address by name.
+        
+        Results are cached per normalized name for five minutes (misses for
+        30 seconds) or until the next contacts sync.
+        
+        Args:
+            name: Contact name to search for
+            
+        Returns:
+            Contact dict with an 'email' key, or None if not found
+        """
+        key = name.strip().casefold()
+        contact = self._contact_cache.get(key, _MISSING)
+        if contact is _MISSING:
+            contact = self._lookup_contact(key)
+            if contact is None:
+                self._contact_cache.set(key, None, ttl=_CONTACT_NOT_FOUND_TTL)
+            else:
+                self._contact_cache[key] = contact
+        return contact
+    
+    def _lookup_contact(self, name):
+        """Look up a contact in Google Contacts first, then in the local DB."""
+        # Query the local DB while waiting on Google, so a Google miss doesn't add its latency
+        local_future = _contact_executor.submit(self._lookup_local_contact, name)
+        
+        # Try Google Contacts first
+        contact = None
+        try:
+            contact = self.contacts_service.get_contact_by_name(name)
+        except Exception as e:
+            logger.error("Error finding contact via Google: %s", e)
+        
+        # If not found in Google, use the local DB result
+        if not contact or not contact.get("email"):
+            contact = local_future.result()
+        
+        return contact if contact and contact.get("email") else None
+    
+    def _lookup_local_contact(self, name):
+        """Look up a contact in the local DB, or return None on error."""
+        try:
+            return self.contacts_db_service.get_contact_by_name(name)
+        except Exception as e:
+            logger.error("Error finding contact in local DB: %s", e)
+            return None
+    
     def _send_response(self, to_number, message):
         """ Send a response to the user.
         Args:
         to_number: Recipient's phone number
         message: Message content"""
-        print(f"Sending response to {to_number}: {message}")
-        self.whatsapp_client.send_message(to_number, message)                    
+        logger.debug("Sending response to %s: %s", to_number, message)
+        
+        # Queue the reply if a message from this user is being handled on this thread
+        pending = getattr(self._outbox, "messages", None)
+        if pending is not None:
+            pending.append((to_number, message))
+            return
+        
+        self._deliver(to_number, message)
+    
+    def _flush_responses(self, from_number, messages):
+        """
+        Send queued replies, joining consecutive replies to the same number into one message.
+        
+        Args:
+            from_number: Sender's phone number
+            messages: List of (to_number, message) tuples in the order they were queued
+        """
+        to_send = []
+        for to_number, message in messages:
+            if to_send and to_send[-1][0] == to_number and \
+                    len(to_send[-1][1]) + len(message) + 2 <= _MAX_MESSAGE_LENGTH:
+                to_send[-1] = (to_number, to_send[-1][1] + "\n\n" + message)
+            else:
+                to_send.append((to_number, message))
+        
+        for to_number, message in to_send:
+            self._deliver(to_number, message)
+    
+    def _deliver(self, to_number, message):
+        """Send a message through the WhatsApp client, in the background if enabled."""
+        if self.background_send:
+            _send_executors[hash(to_number) % len(_send_executors)].submit(
+                self.whatsapp_client.send_message, to_number, message
+            )
+        else:
+            self.whatsapp_client.send_message(to_number, message)
     
     
-    def _handle_check_free_slots(self, from_number, message_text, entities):
+    def _handle_check_free_slots(self, from_number, message_text, entities, now):
         """
         Handle checking free time slots intent.
         
@@ -1074,13 +1248,14 @@ class MessageHandler:
             from_number: Sender's phone number
             message_text: Message content
             entities: Extracted entities
+            now: Current time in the configured timezone
         """
         # Extract date
         date = entities.get("date")
         
         if not date:
             # Default to today
-            date = get_current_time().date()
+            date = now.date()
         
         # Get free slots
         free_slots = self.calendar_service.get_free_slots(
@@ -1092,11 +1267,11 @@ class MessageHandler:
         
         if free_slots:
             # Format free slots
-            formatted_slots = self.calendar_service.format_free_slots(free_slots)
+            formatted_slots = self.calendar_service.format_free_slots(free_slots, prefix="🕒 ")
             
             self._send_response(from_number, 
-                f"📅 Free 30-minute slots for {format_date(date)}:\n\n" +
-                "\n".join([f"🕒 {slot}" for slot in formatted_slots])
+                _format_free_slots_header(format_date(date)) +
+                "\n".join(formatted_slots)
             )
         else:
             self._send_response(from_number, 
@@ -1,6 +1,7 @@
 """
 WhatsApp client integration using Twilio's official API.
 """
+import logging
 import os
 from twilio.rest import Client
 from twilio.base.exceptions import TwilioRestException
@@ -12,6 +13,8 @@ from app.config import (
     DEBUG
 )
 
+logger = logging.getLogger(__name__)
+
 class TwilioWhatsAppClient:
     def __init__(self, on_message=None):
         """
@@ -79,10 +82,10 @@ class TwilioWhatsAppClient:
             }
             
         except TwilioRestException as e:
-            print(f"Twilio API error: {e}")
+            logger.error("Twilio API error: %s", e)
             return {"success": False, "error": f"Twilio API error: {e}"}
         except Exception as e:
-            print(f"Error sending WhatsApp message: {e}")
+            logger.error("Error sending WhatsApp message: %s", e)
             return {"success": False, "error": f"Error sending message: {e}"}
     
     def process_incoming_webhook(self, request_data):
@@ -120,5 +123,5 @@ class TwilioWhatsAppClient:
             }
             
         except Exception as e:
-            print(f"Error processing webhook data: {e}")
+            logger.error("Error processing webhook data: %s", e)
             return None
\ No newline at end of file
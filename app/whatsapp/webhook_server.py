@@ -1,11 +1,14 @@
 """
 Flask server for handling Twilio WhatsApp webhooks.
 """
+import logging
 import threading
 from flask import Flask, request
 from twilio.twiml.messaging_response import MessagingResponse
 
-from app.config import SERVER_HOST, SERVER_PORT, DEBUG
+from app.config import SERVER_HOST, SERVER_PORT
+
+logger = logging.getLogger(__name__)
 
 class WebhookServer:
     def __init__(self, message_handler):
@@ -35,8 +38,7 @@ class WebhookServer:
             # Process the incoming message
             form_data = request.form.to_dict()
             
-            if DEBUG:
-                print(f"Received webhook: {form_data}")
+            logger.debug("Received webhook: %s", form_data)
             
             # Extract message details
             from_number = form_data.get('From', '')
@@ -59,7 +61,7 @@ class WebhookServer:
                 ).start()
             
         except Exception as e:
-            print(f"Error handling webhook: {e}")
+            logger.exception("Error handling webhook: %s", e)
         
         # Return empty response (processing happens asynchronously)
         return str(resp)